@@ -8,9 +8,10 @@ e o background com gradiente/curvas é adicionado pelo ImageMagick posteriorment
 """
 
 import sys
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import cv2
 import numpy as np
-from PIL import Image
 import json
 import os
 
@@ -18,12 +19,16 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'screenshots'))
 from config.screenshot_config import ScreenshotConfig, DeviceConfig, get_interpolation_method, get_border_mode
 
+@functools.lru_cache(maxsize=8)
+def _load_template_index(index_path, mtime_ns):
+    """Lê index.json; memoizado por (caminho, mtime) para reler só se o arquivo mudar"""
+    with open(index_path, 'r') as f:
+        return json.load(f)
+
 def load_template_config(template_dir, template_slug):
     """Carrega configuração do template"""
     index_path = os.path.join(template_dir, 'index.json')
-
-    with open(index_path, 'r') as f:
-        config = json.load(f)
+    config = _load_template_index(index_path, os.stat(index_path).st_mtime_ns)
 
     # Procurar template pelo slug
     for template in config.get('templates', []):
@@ -32,58 +37,162 @@ def load_template_config(template_dir, template_slug):
 
     raise ValueError(f"Template '{template_slug}' não encontrado")
 
-def apply_rounded_corners_simple(image, corner_radius):
+# Caches por raio (mesmo template => mesmo raio)
+_corner_quadrant_cache = {}
+_corner_patch_cache = {}
+
+def _get_corner_quadrant(radius):
     """
-    Aplica cantos arredondados a uma imagem.
+    Retorna a máscara (radius x radius) do canto superior esquerdo.
+
+    Pixels dentro do círculo centrado em (radius, radius) recebem
+    MASK_VALUE_ALLOW; os demais, MASK_VALUE_BLOCK. Os outros cantos
+    são obtidos espelhando este quadrante.
+    """
+    quadrant = _corner_quadrant_cache.get(radius)
+    if quadrant is None:
+        yy, xx = np.ogrid[:radius, :radius]
+        inside = (yy - radius) ** 2 + (xx - radius) ** 2 <= radius * radius
+        quadrant = np.where(
+            inside, ScreenshotConfig.MASK_VALUE_ALLOW, ScreenshotConfig.MASK_VALUE_BLOCK
+        ).astype(np.uint8)
+        _corner_quadrant_cache[radius] = quadrant
+    return quadrant
+
+def _smooth_mask(mask):
+    """
+    Suaviza a máscara (GaussianBlur) para evitar bordas serrilhadas.
+
+    Aplicado para qualquer raio: o patch do canto já tem a faixa de
+    meio-kernel, então nunca é menor que o kernel.
+    """
+    return cv2.GaussianBlur(
+        mask,
+        ScreenshotConfig.BLUR_KERNEL_SIZE,
+        ScreenshotConfig.BLUR_SIGMA
+    )
+
+def _get_corner_patches(radius):
+    """
+    Retorna as máscaras suavizadas dos quatro cantos (TL, TR, BL, BR).
+
+    Cada patch tem (radius + 2 * meio-kernel) pixels de lado: o quadrante
+    do canto mais uma faixa sólida (255) para que o blur com borda refletida
+    dê o mesmo resultado do blur sobre a máscara inteira. O blur é simétrico,
+    então os outros cantos são o patch TL espelhado.
+    """
+    patches = _corner_patch_cache.get(radius)
+    if patches is None:
+        pad = max(ScreenshotConfig.BLUR_KERNEL_SIZE) // 2
+        patch_size = radius + 2 * pad
+
+        patch = np.full((patch_size, patch_size), ScreenshotConfig.MASK_VALUE_ALLOW, dtype=np.uint8)
+        patch[0:radius, 0:radius] = _get_corner_quadrant(radius)
+
+        # Aplicar suavização para evitar bordas serrilhadas
+        patch = _smooth_mask(patch)
+
+        patches = tuple(
+            np.ascontiguousarray(p)
+            for p in (patch, patch[:, ::-1], patch[::-1, :], patch[::-1, ::-1])
+        )
+        _corner_patch_cache[radius] = patches
+    return patches
+
+@functools.lru_cache(maxsize=16)
+def _build_full_mask(h, w, radius):
+    """
+    Máscara HxW completa, usada quando os patches dos cantos se sobrepõem.
+
+    Memoizada por (h, w, radius): screenshots do mesmo device/template
+    compartilham dimensões, então a máscara é gerada uma vez por lote.
+    """
+    quadrant = _get_corner_quadrant(radius)
+
+    corners_mask = np.full((h, w), ScreenshotConfig.MASK_VALUE_ALLOW, dtype=np.uint8)
+    corners_mask[0:radius, 0:radius] = quadrant
+    corners_mask[0:radius, w-radius:w] = quadrant[:, ::-1]
+    corners_mask[h-radius:h, 0:radius] = quadrant[::-1, :]
+    corners_mask[h-radius:h, w-radius:w] = quadrant[::-1, ::-1]
+
+    mask = _smooth_mask(corners_mask)
+    # Compartilhada entre chamadas: proteger contra escrita acidental
+    mask.flags.writeable = False
+    return mask
+
+def _multiply_alpha(alpha, mask):
+    """
+    Compõe alpha com a máscara, in-place: round(alpha * mask / 255).
+
+    Equivale a (alpha * mask + 127) // 255 para todo par uint8 (não um AND
+    bit a bit, que corromperia os tons intermediários da borda suavizada)
+    e usa o caminho SIMD do OpenCV.
+
+    Se alpha tem linhas contíguas (plano separado ou ROI dele), o OpenCV
+    escreve direto nele via dst, sem buffer intermediário. A view
+    image[:, :, 3] (stride 4) não é aceita como dst e recebe uma cópia.
+    """
+    if alpha.strides[1] == alpha.itemsize:
+        cv2.multiply(alpha, mask, dst=alpha, scale=1.0 / 255)
+    else:
+        alpha[:, :] = cv2.multiply(alpha, mask, scale=1.0 / 255)
+    return alpha
+
+def round_alpha_corners(alpha, corner_radius):
+    """
+    Arredonda os cantos de um plano alpha (HxW uint8), in-place.
+
+    Aceita tanto um plano alpha separado/contíguo quanto a view image[:, :, 3]
+    de uma imagem BGRA. Apenas as regiões dos cantos são lidas e escritas;
+    o restante da máscara seria 255 (sem efeito).
 
     Args:
-        image: numpy array BGRA
+        alpha: numpy array HxW uint8 (modificado in-place)
         corner_radius: raio dos cantos em pixels
 
     Returns:
-        Imagem com cantos arredondados aplicados
+        O mesmo plano alpha, com cantos arredondados aplicados
     """
-    h, w = image.shape[:2]
+    h, w = alpha.shape[:2]
     radius = int(corner_radius)
 
-    # Se o raio for muito pequeno, retornar imagem original
-    if radius < ScreenshotConfig.MIN_CORNER_RADIUS:
-        return image
+    # Se o raio for muito pequeno (ou maior que a imagem), manter alpha original
+    if radius < ScreenshotConfig.MIN_CORNER_RADIUS or radius >= min(h, w):
+        return alpha
 
-    # Criar máscara com cantos arredondados
-    corners_mask = np.ones((h, w), dtype=np.uint8) * ScreenshotConfig.MASK_VALUE_ALLOW
+    patches = _get_corner_patches(radius)
+    patch_size = patches[0].shape[0]
 
-    # Top-left corner
-    if radius < min(h, w):
-        corners_mask[0:radius, 0:radius] = 0
-        cv2.circle(corners_mask, (radius, radius), radius, 255, -1)
+    # Patches se sobrepõem (imagem pequena): usar máscara inteira
+    if 2 * patch_size > min(h, w):
+        _multiply_alpha(alpha, _build_full_mask(h, w, radius))
+        return alpha
 
-        # Top-right corner
-        corners_mask[0:radius, w-radius:w] = 0
-        cv2.circle(corners_mask, (w - radius - 1, radius), radius, 255, -1)
+    # Aplicar máscara: alpha * mask / 255, só nos cantos
+    top, bottom = slice(0, patch_size), slice(h - patch_size, h)
+    left, right = slice(0, patch_size), slice(w - patch_size, w)
+    for (rows, cols), patch in zip(
+        ((top, left), (top, right), (bottom, left), (bottom, right)), patches
+    ):
+        _multiply_alpha(alpha[rows, cols], patch)
 
-        # Bottom-left corner
-        corners_mask[h-radius:h, 0:radius] = 0
-        cv2.circle(corners_mask, (radius, h - radius - 1), radius, 255, -1)
+    return alpha
 
-        # Bottom-right corner
-        corners_mask[h-radius:h, w-radius:w] = 0
-        cv2.circle(corners_mask, (w - radius - 1, h - radius - 1), radius, 255, -1)
+def apply_rounded_corners_simple(image, corner_radius):
+    """
+    Aplica cantos arredondados a uma imagem.
 
-        # Aplicar suavização para evitar bordas serrilhadas
-        corners_mask = cv2.GaussianBlur(
-            corners_mask,
-            ScreenshotConfig.BLUR_KERNEL_SIZE,
-            ScreenshotConfig.BLUR_SIGMA
-        )
+    O canal alpha é modificado in-place (a imagem não é copiada).
 
-    # Aplicar máscara no canal alpha
-    result = image.copy()
-    original_alpha = result[:, :, 3]
-    masked_alpha = cv2.bitwise_and(original_alpha, corners_mask)
-    result[:, :, 3] = masked_alpha
+    Args:
+        image: numpy array BGRA (modificado in-place)
+        corner_radius: raio dos cantos em pixels
 
-    return result
+    Returns:
+        A mesma imagem, com cantos arredondados aplicados
+    """
+    round_alpha_corners(image[:, :, 3], corner_radius)
+    return image
 
 def resize_to_fit(screenshot, target_width, target_height, corner_radius=0):
     """
@@ -101,37 +210,57 @@ def resize_to_fit(screenshot, target_width, target_height, corner_radius=0):
         Screenshot redimensionado e centralizado (com cantos arredondados se especificado)
     """
     h, w = screenshot.shape[:2]
-    screenshot_aspect = w / h
-    target_aspect = target_width / target_height
-
-    # Calcular novas dimensões mantendo aspect ratio
-    if screenshot_aspect > target_aspect:
-        # Screenshot é mais largo, ajustar pela largura
-        new_width = target_width
-        new_height = int(target_width / screenshot_aspect)
-    else:
-        # Screenshot é mais alto, ajustar pela altura
-        new_height = target_height
-        new_width = int(target_height * screenshot_aspect)
 
-    # Redimensionar
-    resized = cv2.resize(screenshot, (new_width, new_height), interpolation=get_interpolation_method())
+    # Calcular novas dimensões mantendo aspect ratio (sem if/else: a dimensão
+    # limitante fica exatamente no alvo; aritmética inteira evita erro de float)
+    new_width = min(target_width, target_height * w // h)
+    new_height = min(target_height, target_width * h // w)
+
+    # Redimensionar (INTER_AREA ao reduzir, LANCZOS4 ao ampliar)
+    downscale = new_width < w
+    resized = cv2.resize(
+        screenshot,
+        (new_width, new_height),
+        interpolation=get_interpolation_method(downscale=downscale)
+    )
 
     # Aplicar cantos arredondados se especificado
     if corner_radius > 0:
         resized = apply_rounded_corners_simple(resized, corner_radius)
 
-    # Criar canvas com padding transparente
-    canvas = np.zeros((target_height, target_width, 4), dtype=np.uint8)
-
     # Centralizar screenshot no canvas
     y_offset = (target_height - new_height) // 2
     x_offset = (target_width - new_width) // 2
 
-    canvas[y_offset:y_offset+new_height, x_offset:x_offset+new_width] = resized
+    # Adicionar padding transparente (canvas + cópia em uma única passada)
+    canvas = cv2.copyMakeBorder(
+        resized,
+        y_offset,
+        target_height - new_height - y_offset,
+        x_offset,
+        target_width - new_width - x_offset,
+        get_border_mode(),
+        value=ScreenshotConfig.BORDER_VALUE
+    )
 
     return canvas
 
+def _read_image(path):
+    """
+    Lê imagem (com alpha) via np.fromfile + cv2.imdecode.
+
+    O arquivo é lido de uma vez em um buffer e fechado antes de decodificar.
+    Retorna None se o arquivo não puder ser lido ou decodificado, como
+    cv2.imread.
+    """
+    try:
+        buf = np.fromfile(path, dtype=np.uint8)
+    except OSError:
+        return None
+    if buf.size == 0:
+        return None
+    return cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
+
 def apply_mockup(screenshot_path, template_dir, template_slug, output_path):
     """
     Processa screenshot aplicando cantos arredondados.
@@ -147,7 +276,7 @@ def apply_mockup(screenshot_path, template_dir, template_slug, output_path):
     template_config = load_template_config(template_dir, template_slug)
 
     print(f"📸 Carregando screenshot: {screenshot_path}")
-    screenshot = cv2.imread(screenshot_path, cv2.IMREAD_UNCHANGED)
+    screenshot = _read_image(screenshot_path)
     if screenshot is None:
         raise ValueError(f"Não foi possível carregar screenshot: {screenshot_path}")
 
@@ -164,11 +293,51 @@ def apply_mockup(screenshot_path, template_dir, template_slug, output_path):
     result = apply_rounded_corners_simple(screenshot, corner_radius)
 
     print(f"💾 Salvando resultado: {output_path}")
-    cv2.imwrite(output_path, result)
+    cv2.imwrite(
+        output_path,
+        result,
+        [cv2.IMWRITE_PNG_COMPRESSION, ScreenshotConfig.INTERMEDIATE_PNG_COMPRESSION]
+    )
 
     print(f"✅ Screenshot processado com sucesso!")
     return output_path
 
+def _apply_mockup_job(args):
+    """Worker do pool: desempacota argumentos e processa um screenshot"""
+    return apply_mockup(*args)
+
+def apply_mockup_batch(screenshot_paths, template_dir, template_slug, output_dir, max_workers=None):
+    """
+    Processa vários screenshots em paralelo (um processo por CPU).
+
+    Cada screenshot é independente, então o lote é distribuído em um
+    ProcessPoolExecutor. As máscaras dos cantos são geradas antes de criar
+    o pool, para que os workers (fork) já herdem o cache preenchido.
+
+    Args:
+        screenshot_paths: lista de caminhos dos screenshots
+        template_dir: diretório com index.json dos templates
+        template_slug: slug do template
+        output_dir: diretório de saída (mesmo nome de arquivo do screenshot)
+        max_workers: número de processos (padrão: os.cpu_count())
+
+    Returns:
+        Lista com os caminhos de saída, na ordem de entrada
+    """
+    template_config = load_template_config(template_dir, template_slug)
+    corner_radius = int(template_config.get('corner_radius', DeviceConfig.MOCKUP_CORNER_RADIUS))
+    if corner_radius >= ScreenshotConfig.MIN_CORNER_RADIUS:
+        _get_corner_patches(corner_radius)
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [
+        (path, template_dir, template_slug, os.path.join(output_dir, os.path.basename(path)))
+        for path in screenshot_paths
+    ]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(_apply_mockup_job, jobs))
+
 def main():
     if len(sys.argv) < 5:
         print("Uso: apply_mockup.py <screenshot> <template_dir> <template_slug> <output>")
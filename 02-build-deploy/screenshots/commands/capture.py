@@ -116,6 +116,24 @@ class ScreenshotCapture:
         """Print info message"""
         print(f"{self.CYAN}ℹ️  {message}{self.NC}")
 
+    def _scan_screenshots(self) -> List[os.DirEntry]:
+        """
+        List captured screenshots (0*.png) sorted by name
+
+        Uses os.scandir instead of Path.glob: no Path object per entry
+        and the directory is read in a single pass.
+
+        Returns:
+            Directory entries for the screenshot files
+        """
+        with os.scandir(self.screenshots_dir) as entries:
+            screenshots = [
+                entry for entry in entries
+                if entry.name.startswith("0") and entry.name.endswith(".png") and entry.is_file()
+            ]
+        screenshots.sort(key=lambda entry: entry.name)
+        return screenshots
+
     def _prepare_environment(self) -> None:
         """
         Prepare environment for screenshot capture
@@ -138,8 +156,8 @@ class ScreenshotCapture:
             self._print_warning("Removendo screenshots antigos...")
 
             # Remove screenshot files
-            for screenshot in self.screenshots_dir.glob("0*.png"):
-                screenshot.unlink()
+            for screenshot in self._scan_screenshots():
+                os.unlink(screenshot.path)
 
             # Remove mockups directory
             if self.mockups_dir.exists():
@@ -290,17 +308,17 @@ class ScreenshotCapture:
                 f"Platform inválida: {self.platform}. Use 'ios' ou 'android'"
             )
 
-    def _validate_screenshots(self) -> int:
+    def _validate_screenshots(self) -> List[os.DirEntry]:
         """
         Validate that screenshots were captured
 
         Returns:
-            Number of screenshots found
+            Directory entries of the screenshots found (reused by the summary)
 
         Raises:
             ScreenshotCaptureError: If no screenshots found
         """
-        screenshots = sorted(self.screenshots_dir.glob("0*.png"))
+        screenshots = self._scan_screenshots()
         count = len(screenshots)
 
         # Guard clause: No screenshots
@@ -310,10 +328,17 @@ class ScreenshotCapture:
             )
 
         self._print_success(f"{count} screenshots encontrados")
-        return count
+        return screenshots
+
+    def _print_summary(self, screenshots: List[os.DirEntry]) -> None:
+        """
+        Print capture summary
 
-    def _print_summary(self, screenshot_count: int) -> None:
-        """Print capture summary"""
+        Args:
+            screenshots: Entries returned by _validate_screenshots (no rescan;
+                         DirEntry caches its stat result)
+        """
+        screenshot_count = len(screenshots)
         print()
         print(f"{self.MAGENTA}╔════════════════════════════════════════════╗{self.NC}")
         print(f"{self.MAGENTA}║          ✅  CAPTURA CONCLUÍDA  ✅          ║{self.NC}")
@@ -332,7 +357,7 @@ class ScreenshotCapture:
 
         # List captured screenshots
         print(f"{self.CYAN}📸 Arquivos capturados:{self.NC}")
-        for screenshot in sorted(self.screenshots_dir.glob("0*.png")):
+        for screenshot in screenshots:
             size_kb = screenshot.stat().st_size / 1024
             print(f"   {screenshot.name} ({size_kb:.1f} KB)")
 
@@ -366,10 +391,10 @@ class ScreenshotCapture:
             self._capture_screenshots()
 
             # Validate results
-            screenshot_count = self._validate_screenshots()
+            screenshots = self._validate_screenshots()
 
             # Print summary
-            self._print_summary(screenshot_count)
+            self._print_summary(screenshots)
 
             return 0
 
@@ -3,16 +3,23 @@
 Mockup Generation Command
 
 Generates mockups from screenshots using two-step pipeline:
-1. apply_mockup.py: Screenshot → Device frame (flat mockup)
+1. apply_mockup.py (in-process): Screenshot → Device frame (flat mockup)
 2. ImageMagick: Flat mockup → gradient background + decorative curves
 """
 
+import contextlib
+import hashlib
+import importlib.util
+import io
+import shutil
 import subprocess
 import sys
 import os
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 import logging
 
 # Import services and configuration
@@ -20,6 +27,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from config.screenshot_config import MockupConfig, PathConfig, AppleStoreConfig, GooglePlayConfig, FeatureGraphicConfig
 from config.project_config import ProjectConfig, LoyaltyAppConfig, get_project_config
 from services.imagemagick import ImageMagickService, ImageMagickError
+from services.color_utils import hex_to_rgb
 
 
 class MockupGeneratorError(Exception):
@@ -27,6 +35,61 @@ class MockupGeneratorError(Exception):
     pass
 
 
+def _get_scratch_dir() -> Path:
+    """
+    Pick a directory for per-screenshot intermediate PNGs
+
+    Prefers RAM-backed locations (XDG_RUNTIME_DIR, then /dev/shm) so the flat
+    mockup written by apply_mockup and read back by ImageMagick never hits disk.
+
+    Returns:
+        First writable candidate, falling back to /tmp
+    """
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return Path(candidate)
+    return Path("/tmp")
+
+
+# Sources whose changes alter rendered pixels (part of every output cache key)
+PIPELINE_SOURCES = [
+    "apply_mockup.py",
+    "commands/generate_mockups.py",
+    "config/project_config.py",
+    "config/screenshot_config.py",
+    "services/imagemagick.py",
+    "services/curve_generator.py",
+    "services/color_utils.py",
+]
+
+
+def _hash_pipeline_sources(script_dir: Path, templates_dir: Path) -> str:
+    """
+    Digest of the rendering code, settings and device templates
+
+    Args:
+        script_dir: screenshots/ directory
+        templates_dir: Device templates directory (index.json files, PNGs)
+
+    Returns:
+        Hex digest over PIPELINE_SOURCES and every file under templates_dir
+        (missing files are skipped)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path in PIPELINE_SOURCES:
+        source = script_dir / relative_path
+        if source.is_file():
+            digest.update(source.read_bytes())
+
+    # Template corner radii and artwork change the pixels too
+    if templates_dir.is_dir():
+        for template_file in sorted(templates_dir.rglob("*")):
+            if template_file.is_file():
+                digest.update(template_file.relative_to(templates_dir).as_posix().encode())
+                digest.update(template_file.read_bytes())
+    return digest.hexdigest()
+
+
 class GradientStyle:
     """Gradient style definitions"""
 
@@ -37,17 +100,20 @@ class GradientStyle:
     DARK_PURPLE = ("Dark Purple", "#2d3436", "#6c5ce7")
     BOLD_RED_PINK = ("Bold Red/Pink", "#f093fb", "#f5576c")
 
+    # Choices 1-6 in menu order, built once at class creation
+    PREDEFINED = (
+        PREMIUM_PURPLE,
+        OCEAN_BLUE,
+        SUNSET_ORANGE,
+        FRESH_GREEN,
+        DARK_PURPLE,
+        BOLD_RED_PINK,
+    )
+
     @classmethod
     def get_all(cls) -> List[Tuple[str, str, str]]:
         """Get all gradient styles"""
-        return [
-            cls.PREMIUM_PURPLE,
-            cls.OCEAN_BLUE,
-            cls.SUNSET_ORANGE,
-            cls.FRESH_GREEN,
-            cls.DARK_PURPLE,
-            cls.BOLD_RED_PINK
-        ]
+        return list(cls.PREDEFINED)
 
     @classmethod
     def get_custom_from_env(cls) -> Optional[Tuple[str, str, str]]:
@@ -67,18 +133,16 @@ class GradientStyle:
 
         # Create darker shade for gradient end (darken by 30%)
         try:
-            # Parse hex color
-            hex_color = primary_color.lstrip('#')
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
+            # Keep the first six digits (drops an alpha suffix from #RRGGBBAA,
+            # as the original slicing parser did) so every color helper
+            # downstream gets the same strict #RRGGBB the check below accepts
+            primary_color = '#' + primary_color.lstrip('#')[:6]
+            r, g, b = hex_to_rgb(primary_color)
 
             # Darken by 30%
-            darker_r = int(r * 0.7)
-            darker_g = int(g * 0.7)
-            darker_b = int(b * 0.7)
+            darker = int(r * 0.7) << 16 | int(g * 0.7) << 8 | int(b * 0.7)
 
-            darker_color = f'#{darker_r:02x}{darker_g:02x}{darker_b:02x}'
+            darker_color = f'#{darker:06x}'
 
             return ("Client Primary", primary_color, darker_color)
         except (ValueError, IndexError):
@@ -95,7 +159,7 @@ class GradientStyle:
             # Fallback to purple if no custom color
             return cls.PREMIUM_PURPLE
 
-        styles = cls.get_all()
+        styles = cls.PREDEFINED
 
         # Guard clause: Invalid index
         if index < 1 or index > len(styles):
@@ -158,7 +222,12 @@ class MockupGenerator:
         templates_dir: Optional[Path] = None,
         generate_ipad: Optional[bool] = None,
         generate_gplay: Optional[bool] = None,
-        generate_feature_graphic: Optional[bool] = None
+        generate_feature_graphic: Optional[bool] = None,
+        isolate: bool = False,
+        use_cache: bool = True,
+        device_choice: Optional[int] = None,
+        gradient_choice: Optional[int] = None,
+        add_logo: Optional[bool] = None
     ):
         """
         Initialize mockup generator
@@ -172,6 +241,11 @@ class MockupGenerator:
             generate_ipad: Whether to generate iPad versions (None = use project default)
             generate_gplay: Whether to generate Google Play versions (None = use project default)
             generate_feature_graphic: Whether to generate Feature Graphic (None = use project default)
+            isolate: Run apply_mockup.py as a subprocess instead of in-process (debugging)
+            use_cache: Reuse outputs rendered earlier from identical inputs (screenshots_dir/.mockup_cache)
+            device_choice: Device choice 1-2 (None = DEVICE_CHOICE env var or prompt)
+            gradient_choice: Gradient choice 0-6 (None = GRADIENT_CHOICE env var or prompt)
+            add_logo: Whether to add the bottom logo (None = ADD_LOGO env var or prompt)
         """
         self.logger = logging.getLogger(__name__)
 
@@ -186,6 +260,11 @@ class MockupGenerator:
         )
         self.generate_feature_graphic = generate_feature_graphic if generate_feature_graphic is not None else self.project_config.generate_feature_graphic
 
+        # Automated choices (skip the interactive prompts when set)
+        self.device_choice = device_choice
+        self.gradient_choice = gradient_choice
+        self.add_logo = add_logo
+
         # Set up directories using absolute paths
         resolved_file = Path(__file__).resolve()
         self.script_dir = resolved_file.parent.parent
@@ -209,6 +288,16 @@ class MockupGenerator:
 
         self.templates_dir = templates_dir or self.script_dir / "mockupgen_templates"
         self.apply_mockup_script = self.script_dir / "apply_mockup.py"
+        self.isolate = isolate
+        self.use_cache = use_cache
+
+        # No escape sequences when output goes to a file or CI log
+        if not sys.stdout.isatty():
+            self.RED = self.GREEN = self.YELLOW = self.BLUE = self.MAGENTA = self.CYAN = self.NC = ''
+        self.scratch_dir = _get_scratch_dir()
+
+        # Snapshot of top image names, listed once (pickled into the pool workers with self)
+        self._top_image_names = self._list_top_images()
 
         # Output subdirectories for Apple App Store
         # Folder names match Fastlane deliver conventions and expected resolutions
@@ -222,6 +311,12 @@ class MockupGenerator:
         # Feature Graphic output directory
         self.feature_graphic_output_dir = self.output_dir / "feature_graphic"
 
+        # Content-addressed copies of rendered mockups, for incremental re-runs.
+        # Kept beside the screenshots, not in output_dir: capture wipes the
+        # mockups directory before every pipeline run.
+        self.output_cache_dir = self.screenshots_dir / ".mockup_cache"
+        self._pipeline_digest = _hash_pipeline_sources(self.script_dir, self.templates_dir) if use_cache else ""
+
         # Initialize ImageMagick service
         self.imagemagick = ImageMagickService()
 
@@ -244,24 +339,34 @@ class MockupGenerator:
         else:
             self.logger.warning(f"Primary color not found for {self.project_config.project_name}")
 
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a block of lines to stdout in a single write"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def _print_banner(self) -> None:
         """Print application banner"""
         project_name = self.project_config.project_name
-        print()
-        print(f"{self.MAGENTA}╔═══════════════════════════════════════════╗{self.NC}")
-        print(f"{self.MAGENTA}║         📱 Mockup Generator 📱           ║{self.NC}")
-        print(f"{self.MAGENTA}║   Python + OpenCV + ImageMagick Pipeline  ║{self.NC}")
-        print(f"{self.MAGENTA}╚═══════════════════════════════════════════╝{self.NC}")
-        print(f"{self.CYAN}   Project: {project_name}{self.NC}")
-        print()
+        self._write_lines([
+            "",
+            f"{self.MAGENTA}╔═══════════════════════════════════════════╗{self.NC}",
+            f"{self.MAGENTA}║         📱 Mockup Generator 📱           ║{self.NC}",
+            f"{self.MAGENTA}║   Python + OpenCV + ImageMagick Pipeline  ║{self.NC}",
+            f"{self.MAGENTA}╚═══════════════════════════════════════════╝{self.NC}",
+            f"{self.CYAN}   Project: {project_name}{self.NC}",
+            "",
+        ])
 
     def _print_section(self, title: str) -> None:
         """Print section header"""
-        print()
-        print(f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print(f"{self.BLUE}{title}{self.NC}")
-        print(f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print()
+        self._write_lines([
+            "",
+            f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}",
+            f"{self.BLUE}{title}{self.NC}",
+            f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}",
+            "",
+        ])
 
     def _print_success(self, message: str) -> None:
         """Print success message"""
@@ -285,7 +390,11 @@ class MockupGenerator:
         if not self.output_dir.exists():
             return
 
-        old_mockups = list(self.output_dir.glob("*_mockup.png"))
+        with os.scandir(self.output_dir) as entries:
+            old_mockups = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith("_mockup.png") and entry.is_file()
+            ]
         if old_mockups:
             self._print_info(f"Removendo {len(old_mockups)} mockups antigos da raiz...")
             for old_file in old_mockups:
@@ -306,11 +415,8 @@ class MockupGenerator:
         if sys.version_info < (3, 7):
             raise MockupGeneratorError("Python 3.7+ required")
 
-        # Check OpenCV and NumPy
-        try:
-            import cv2
-            import numpy
-        except ImportError:
+        # Check OpenCV and NumPy (probe only: they are imported by apply_mockup when used)
+        if importlib.util.find_spec("cv2") is None or importlib.util.find_spec("numpy") is None:
             raise MockupGeneratorError(
                 "OpenCV/NumPy not installed!\n"
                 "Install: pip3 install opencv-python numpy pillow"
@@ -357,7 +463,13 @@ class MockupGenerator:
         Raises:
             MockupGeneratorError: If no screenshots found
         """
-        screenshots = sorted(self.screenshots_dir.glob("0*.png"))
+        screenshots = []
+        if self.screenshots_dir.is_dir():
+            with os.scandir(self.screenshots_dir) as entries:
+                screenshots = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.startswith("0") and entry.name.endswith(".png") and entry.is_file()
+                )
 
         # Guard clause: No screenshots found
         if not screenshots:
@@ -368,6 +480,23 @@ class MockupGenerator:
 
         return screenshots
 
+    def _list_top_images(self) -> set:
+        """
+        List the PNG top images available, by name without extension
+
+        Returns:
+            Set of top image stems (empty if the directory does not exist)
+        """
+        if self.top_images_dir is None or not self.top_images_dir.is_dir():
+            return set()
+
+        with os.scandir(self.top_images_dir) as entries:
+            return {
+                entry.name[:-len(".png")]
+                for entry in entries
+                if entry.name.endswith(".png") and entry.is_file()
+            }
+
     def _find_top_image(self, screenshot_name: str) -> Optional[Path]:
         """
         Find a matching top image for a screenshot.
@@ -384,17 +513,13 @@ class MockupGenerator:
         Returns:
             Path to matching top image, or None if not found
         """
-        if not self.top_images_dir.exists():
+        # Simple exact match: top image has same name as screenshot
+        if screenshot_name not in self._top_image_names:
             return None
 
-        # Simple exact match: top image has same name as screenshot
         top_image_path = self.top_images_dir / f"{screenshot_name}.png"
-
-        if top_image_path.exists():
-            self.logger.info(f"Found top image: {top_image_path.name}")
-            return top_image_path
-
-        return None
+        self.logger.info(f"Found top image: {top_image_path.name}")
+        return top_image_path
 
     def _find_transparent_logo(self) -> Optional[Path]:
         """
@@ -463,7 +588,8 @@ class MockupGenerator:
         self,
         prompt: str,
         default: int,
-        env_var: Optional[str] = None
+        env_var: Optional[str] = None,
+        value: Optional[int] = None
     ) -> int:
         """
         Get user choice with support for environment variables
@@ -472,10 +598,16 @@ class MockupGenerator:
             prompt: Prompt to display
             default: Default value
             env_var: Environment variable name to check
+            value: Choice passed by the caller (takes precedence over env_var)
 
         Returns:
             User's choice
         """
+        # Guard clause: Choice already given to the constructor
+        if value is not None:
+            print(f"Escolha (automática): {value}")
+            return value
+
         # Check environment variable first
         if env_var and os.getenv(env_var):
             value = int(os.getenv(env_var))
@@ -509,7 +641,8 @@ class MockupGenerator:
         choice = self._get_user_choice(
             "Escolha (1-2)",
             default=1,
-            env_var="DEVICE_CHOICE"
+            env_var="DEVICE_CHOICE",
+            value=self.device_choice
         )
 
         return DeviceType.get_by_choice(choice)
@@ -536,7 +669,8 @@ class MockupGenerator:
         choice = self._get_user_choice(
             "Escolha (0-6)",
             default=0,
-            env_var="GRADIENT_CHOICE"
+            env_var="GRADIENT_CHOICE",
+            value=self.gradient_choice
         )
 
         # Load PRIMARY_COLOR from config.json if choice is 0
@@ -552,6 +686,11 @@ class MockupGenerator:
         Returns:
             True if user wants to add logo, False otherwise
         """
+        # Guard clause: Choice already given to the constructor
+        if self.add_logo is not None:
+            print(f"Adicionar logo (automático): {'Sim' if self.add_logo else 'Não'}")
+            return self.add_logo
+
         # Check environment variable first
         env_value = os.getenv('ADD_LOGO')
         if env_value is not None:
@@ -588,6 +727,57 @@ class MockupGenerator:
         """
         Generate flat mockup using apply_mockup.py
 
+        Runs in-process instead of spawning a new interpreter per screenshot:
+        avoids Python/OpenCV startup on every call and keeps apply_mockup's
+        per-radius mask caches warm across the batch.
+
+        Args:
+            screenshot_path: Path to screenshot
+            template_slug: Device template slug
+            output_path: Output path for flat mockup
+
+        Raises:
+            MockupGeneratorError: If generation fails
+        """
+        # Guard clause: Isolated mode (debugging) runs the script standalone
+        if self.isolate:
+            self._generate_flat_mockup_subprocess(screenshot_path, template_slug, output_path)
+            return
+
+        # Imported lazily: requires OpenCV/NumPy (checked in _check_dependencies)
+        from apply_mockup import apply_mockup
+
+        try:
+            # apply_mockup prints every step; keep batch output compact
+            with contextlib.redirect_stdout(io.StringIO()):
+                apply_mockup(
+                    str(screenshot_path),
+                    str(self.templates_dir),
+                    template_slug,
+                    str(output_path)
+                )
+        except (ValueError, KeyError, OSError) as e:
+            raise MockupGeneratorError(
+                f"Failed to generate flat mockup: {e}"
+            )
+
+        # Guard clause: Output file not created
+        if not output_path.exists():
+            raise MockupGeneratorError(
+                f"Flat mockup not created: {output_path}"
+            )
+
+    def _generate_flat_mockup_subprocess(
+        self,
+        screenshot_path: Path,
+        template_slug: str,
+        output_path: Path
+    ) -> None:
+        """
+        Generate flat mockup by running apply_mockup.py in a separate process
+
+        Used with --isolate, to debug apply_mockup.py on its own.
+
         Args:
             screenshot_path: Path to screenshot
             template_slug: Device template slug
@@ -605,16 +795,18 @@ class MockupGenerator:
             str(output_path)
         ]
 
+        # stdout is never inspected; stderr is kept as bytes and decoded only on failure
         try:
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
         except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode(errors="replace") if e.stderr else ""
             raise MockupGeneratorError(
-                f"Failed to generate flat mockup: {e.stderr}"
+                f"Failed to generate flat mockup: {stderr}"
             )
 
         # Guard clause: Output file not created
@@ -646,6 +838,124 @@ class MockupGenerator:
             gradient_end=gradient_end
         )
 
+    def _variant_sizes(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Canvas size (width, height) of each enabled output variant
+
+        Returns:
+            Dict mapping variant name ('iphone', 'ipad', 'gplay_phone',
+            'gplay_tablet') to its canvas size
+        """
+        sizes = {}
+        if self.generate_iphone:
+            sizes['iphone'] = (MockupConfig.CANVAS_WIDTH, MockupConfig.CANVAS_HEIGHT)
+        if self.generate_ipad:
+            sizes['ipad'] = (AppleStoreConfig.IPAD_13_WIDTH, AppleStoreConfig.IPAD_13_HEIGHT)
+        if self.generate_gplay:
+            sizes['gplay_phone'] = (GooglePlayConfig.PHONE_WIDTH, GooglePlayConfig.PHONE_HEIGHT)
+            sizes['gplay_tablet'] = (GooglePlayConfig.TABLET_WIDTH, GooglePlayConfig.TABLET_HEIGHT)
+        return sizes
+
+    def _gradient_sizes(self) -> List[Tuple[int, int]]:
+        """
+        Canvas sizes (width, height) that need a gradient background
+
+        Returns:
+            One entry per enabled output that uses the vertical gradient
+        """
+        return list(self._variant_sizes().values())
+
+    def _output_cache_key(
+        self,
+        screenshot_path: Path,
+        template_slug: str,
+        gradient_start: str,
+        gradient_end: str,
+        top_image_path: Optional[Path],
+        bottom_logo_path: Optional[Path]
+    ) -> str:
+        """
+        Hash every input that affects the mockups of one screenshot
+
+        Covers the screenshot, top image and logo bytes, the gradient, the
+        template, the file name (curve seed) and the rendering code itself.
+
+        Returns:
+            Hex digest shared by all variants of the screenshot
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(screenshot_path.read_bytes())
+        for extra_path in (top_image_path, bottom_logo_path):
+            digest.update(extra_path.read_bytes() if extra_path else b"")
+        digest.update(
+            f"{screenshot_path.stem}|{template_slug}|{gradient_start}|{gradient_end}|{self._pipeline_digest}".encode()
+        )
+        return digest.hexdigest()
+
+    def _restore_cached_outputs(self, cache_key: Optional[str], outputs: dict) -> set:
+        """
+        Copy cached mockups into place for the variants that have one
+
+        Args:
+            cache_key: Key from _output_cache_key (None = cache disabled)
+            outputs: Mapping variant -> output path
+
+        Returns:
+            Set of variants restored from the cache
+        """
+        # Guard clause: Cache disabled
+        if cache_key is None:
+            return set()
+
+        restored = set()
+        for variant, output_path in outputs.items():
+            cached_path = self.output_cache_dir / f"{cache_key}_{variant}.png"
+            if cached_path.is_file():
+                shutil.copyfile(cached_path, output_path)
+                # Mark as used in this run so _prune_output_cache keeps it
+                os.utime(cached_path)
+                restored.add(variant)
+        return restored
+
+    def _store_cached_output(self, cache_key: Optional[str], variant: str, output_path: Path) -> None:
+        """
+        Keep a copy of a freshly rendered mockup in the output cache
+
+        Args:
+            cache_key: Key from _output_cache_key (None = cache disabled)
+            variant: Output variant ('iphone', 'ipad', 'gplay_phone', 'gplay_tablet')
+            output_path: Rendered mockup
+        """
+        # Guard clause: Cache disabled
+        if cache_key is None:
+            return
+
+        cached_path = self.output_cache_dir / f"{cache_key}_{variant}.png"
+        # Copy to a private name and rename: parallel workers never see partial files
+        temp_path = cached_path.with_name(f"{cached_path.stem}.{os.getpid()}.png")
+        shutil.copyfile(output_path, temp_path)
+        os.replace(temp_path, cached_path)
+
+    def _prune_output_cache(self, run_started: float) -> None:
+        """
+        Delete cached mockups that the current run neither restored nor stored
+
+        Restored entries are touched and stored entries are written during
+        the run, so anything older than run_started belongs to inputs that no
+        longer exist (edited screenshots, other gradients, old code).
+
+        Args:
+            run_started: time.time() taken before any screenshot was processed
+        """
+        # Guard clause: Cache disabled or never created
+        if not self.use_cache or not self.output_cache_dir.is_dir():
+            return
+
+        with os.scandir(self.output_cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < run_started:
+                    os.unlink(entry.path)
+
     def _process_screenshot(
         self,
         screenshot_path: Path,
@@ -676,9 +986,11 @@ class MockupGenerator:
         filename = screenshot_path.name
         name = screenshot_path.stem
 
-        # Temporary files
-        temp_flat = Path("/tmp") / f"mockup_flat_{name}.png"
-        temp_large_mockup = Path("/tmp") / f"mockup_large_{name}.png"
+        # Temporary files (PID in the name: screenshots run in parallel workers)
+        temp_flat = self.scratch_dir / f"mockup_flat_{os.getpid()}_{name}.png"
+        temp_large_mockup = self.scratch_dir / f"mockup_large_{os.getpid()}_{name}.png"
+        # Uncompressed pixel cache is large (tens of MB per worker): keep it off /dev/shm
+        temp_source = Path("/tmp") / f"mockup_source_{os.getpid()}_{name}.mpc"
 
         # Output files
         iphone_output = self.iphone_output_dir / f"{name}_mockup.png"
@@ -708,22 +1020,55 @@ class MockupGenerator:
             print(f"   🏷️  Logo inferior: {bottom_logo_path.name}")
 
         try:
+            # Variants already rendered from identical inputs are copied from the cache
+            outputs = {}
+            if self.generate_iphone:
+                outputs['iphone'] = iphone_output
+            if self.generate_ipad:
+                outputs['ipad'] = ipad_output
+            if self.generate_gplay:
+                outputs['gplay_phone'] = gplay_phone_output
+                outputs['gplay_tablet'] = gplay_tablet_output
+            cache_key = None
+            if self.use_cache:
+                cache_key = self._output_cache_key(
+                    screenshot_path, template_slug, gradient_start, gradient_end,
+                    top_image_path, bottom_logo_path
+                )
+            restored = self._restore_cached_outputs(cache_key, outputs)
+
+            # iPad and both Google Play targets crop/resize the raw screenshot:
+            # decode it once to a pixel cache and let each target read that
+            source_path = screenshot_path
+            if {'ipad', 'gplay_phone', 'gplay_tablet'} & (outputs.keys() - restored):
+                source_path = self.imagemagick.decode_to_pixel_cache(screenshot_path, temp_source)
+
+            # Draw this screenshot's curve layers for every pending size in one magick call
+            curve_sizes = [
+                size for variant, size in self._variant_sizes().items()
+                if variant not in restored
+            ]
+            if curve_sizes:
+                self.imagemagick.prerender_curves(gradient_start, curve_sizes, curve_seed)
+
             # === APPLE IPHONE MOCKUP ===
             if self.generate_iphone:
-                # Step 1: Generate flat mockup (screenshot with rounded corners)
                 print("   🍎 iPhone 6.7\": Aplicando cantos arredondados + curvas decorativas...")
-                self._generate_flat_mockup(screenshot_path, template_slug, temp_flat)
-
-                # Step 2: Apply gradient background with decorative curves (and optional top image/bottom logo)
-                self.imagemagick.create_iphone_mockup_with_curves(
-                    flat_mockup_path=temp_flat,
-                    output_path=iphone_output,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    seed=curve_seed,
-                    top_image_path=top_image_path,
-                    bottom_logo_path=bottom_logo_path
-                )
+                if 'iphone' not in restored:
+                    # Step 1: Generate flat mockup (screenshot with rounded corners)
+                    self._generate_flat_mockup(screenshot_path, template_slug, temp_flat)
+
+                    # Step 2: Apply gradient background with decorative curves (and optional top image/bottom logo)
+                    self.imagemagick.create_iphone_mockup_with_curves(
+                        flat_mockup_path=temp_flat,
+                        output_path=iphone_output,
+                        gradient_start=gradient_start,
+                        gradient_end=gradient_end,
+                        seed=curve_seed,
+                        top_image_path=top_image_path,
+                        bottom_logo_path=bottom_logo_path
+                    )
+                    self._store_cached_output(cache_key, 'iphone', iphone_output)
 
                 size_mb = iphone_output.stat().st_size / (1024 * 1024)
                 print(f"   {self.GREEN}✅{self.NC} iPhone 6.7\" (1290x2796) - {size_mb:.2f} MB")
@@ -733,15 +1078,17 @@ class MockupGenerator:
             # Google Play prohibits device frames - create clean screenshot with curves
             if self.generate_gplay:
                 print("   🤖 Google Play Phone: Criando versão sem frame + curvas...")
-                self.imagemagick.create_google_play_phone_screenshot_with_curves(
-                    input_path=screenshot_path,
-                    output_path=gplay_phone_output,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    seed=curve_seed,
-                    top_image_path=top_image_path,
-                    bottom_logo_path=bottom_logo_path
-                )
+                if 'gplay_phone' not in restored:
+                    self.imagemagick.create_google_play_phone_screenshot_with_curves(
+                        input_path=source_path,
+                        output_path=gplay_phone_output,
+                        gradient_start=gradient_start,
+                        gradient_end=gradient_end,
+                        seed=curve_seed,
+                        top_image_path=top_image_path,
+                        bottom_logo_path=bottom_logo_path
+                    )
+                    self._store_cached_output(cache_key, 'gplay_phone', gplay_phone_output)
 
                 size_mb = gplay_phone_output.stat().st_size / (1024 * 1024)
                 print(f"   {self.GREEN}✅{self.NC} GPlay Phone (1080x1920) - {size_mb:.2f} MB")
@@ -750,15 +1097,17 @@ class MockupGenerator:
             # === APPLE IPAD MOCKUP ===
             if self.generate_ipad:
                 print("   🍎 iPad 12.9\": Criando versão tablet + curvas...")
-                self.imagemagick.create_ipad_screenshot_with_curves(
-                    input_path=screenshot_path,
-                    output_path=ipad_output,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    seed=curve_seed,
-                    top_image_path=top_image_path,
-                    bottom_logo_path=bottom_logo_path
-                )
+                if 'ipad' not in restored:
+                    self.imagemagick.create_ipad_screenshot_with_curves(
+                        input_path=source_path,
+                        output_path=ipad_output,
+                        gradient_start=gradient_start,
+                        gradient_end=gradient_end,
+                        seed=curve_seed,
+                        top_image_path=top_image_path,
+                        bottom_logo_path=bottom_logo_path
+                    )
+                    self._store_cached_output(cache_key, 'ipad', ipad_output)
 
                 size_mb = ipad_output.stat().st_size / (1024 * 1024)
                 print(f"   {self.GREEN}✅{self.NC} iPad 12.9\" (2048x2732) - {size_mb:.2f} MB")
@@ -767,15 +1116,17 @@ class MockupGenerator:
             # === GOOGLE PLAY TABLET MOCKUP ===
             if self.generate_gplay:
                 print("   🤖 Google Play Tablet: Criando versão tablet + curvas...")
-                self.imagemagick.create_google_play_tablet_screenshot_with_curves(
-                    input_path=screenshot_path,
-                    output_path=gplay_tablet_output,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    seed=curve_seed,
-                    top_image_path=top_image_path,
-                    bottom_logo_path=bottom_logo_path
-                )
+                if 'gplay_tablet' not in restored:
+                    self.imagemagick.create_google_play_tablet_screenshot_with_curves(
+                        input_path=source_path,
+                        output_path=gplay_tablet_output,
+                        gradient_start=gradient_start,
+                        gradient_end=gradient_end,
+                        seed=curve_seed,
+                        top_image_path=top_image_path,
+                        bottom_logo_path=bottom_logo_path
+                    )
+                    self._store_cached_output(cache_key, 'gplay_tablet', gplay_tablet_output)
 
                 size_mb = gplay_tablet_output.stat().st_size / (1024 * 1024)
                 print(f"   {self.GREEN}✅{self.NC} GPlay Tablet (1600x2560) - {size_mb:.2f} MB")
@@ -790,7 +1141,7 @@ class MockupGenerator:
 
         finally:
             # Clean up temporary files
-            for temp_file in [temp_flat, temp_large_mockup]:
+            for temp_file in [temp_flat, temp_large_mockup, temp_source, temp_source.with_suffix(".cache")]:
                 if temp_file.exists():
                     temp_file.unlink()
 
@@ -804,50 +1155,52 @@ class MockupGenerator:
         counts: dict
     ) -> None:
         """Print generation summary"""
-        print(f"{self.MAGENTA}╔═══════════════════════════════════════════╗{self.NC}")
-        print(f"{self.MAGENTA}║        ✨  MOCKUPS GERADOS  ✨            ║{self.NC}")
-        print(f"{self.MAGENTA}╚═══════════════════════════════════════════╝{self.NC}")
-        print()
+        lines = []
+        lines.append(f"{self.MAGENTA}╔═══════════════════════════════════════════╗{self.NC}")
+        lines.append(f"{self.MAGENTA}║        ✨  MOCKUPS GERADOS  ✨            ║{self.NC}")
+        lines.append(f"{self.MAGENTA}╚═══════════════════════════════════════════╝{self.NC}")
+        lines.append("")
 
-        print(f"{self.CYAN}📊 Resumo:{self.NC}")
-        print(f"   Screenshots processados: {self.YELLOW}{total_processed}{self.NC}")
-        print(f"   Cor: {self.YELLOW}{style_name}{self.NC}")
-        print()
+        lines.append(f"{self.CYAN}📊 Resumo:{self.NC}")
+        lines.append(f"   Screenshots processados: {self.YELLOW}{total_processed}{self.NC}")
+        lines.append(f"   Cor: {self.YELLOW}{style_name}{self.NC}")
+        lines.append("")
 
         # Apple App Store (only show if any Apple output was generated)
         if self.generate_iphone or self.generate_ipad:
-            print(f"{self.CYAN}🍎 Apple App Store:{self.NC}")
+            lines.append(f"{self.CYAN}🍎 Apple App Store:{self.NC}")
             if self.generate_iphone:
-                print(f"   iPhone 6.7\" (1290x2796): {self.YELLOW}{counts['iphone']}{self.NC} mockups")
+                lines.append(f"   iPhone 6.7\" (1290x2796): {self.YELLOW}{counts['iphone']}{self.NC} mockups")
             if self.generate_ipad:
-                print(f"   iPad 12.9\" (2048x2732): {self.YELLOW}{counts['ipad']}{self.NC} mockups")
-            print()
+                lines.append(f"   iPad 12.9\" (2048x2732): {self.YELLOW}{counts['ipad']}{self.NC} mockups")
+            lines.append("")
 
         # Google Play Store
         if self.generate_gplay:
-            print(f"{self.CYAN}🤖 Google Play Store:{self.NC}")
-            print(f"   Phone (1080x1920): {self.YELLOW}{counts['gplay_phone']}{self.NC} mockups")
-            print(f"   Tablet 10\" (1600x2560): {self.YELLOW}{counts['gplay_tablet']}{self.NC} mockups")
+            lines.append(f"{self.CYAN}🤖 Google Play Store:{self.NC}")
+            lines.append(f"   Phone (1080x1920): {self.YELLOW}{counts['gplay_phone']}{self.NC} mockups")
+            lines.append(f"   Tablet 10\" (1600x2560): {self.YELLOW}{counts['gplay_tablet']}{self.NC} mockups")
             if self.generate_feature_graphic and counts.get('feature_graphic', 0) > 0:
-                print(f"   Feature Graphic (1024x500): {self.YELLOW}1{self.NC} imagem")
-            print()
+                lines.append(f"   Feature Graphic (1024x500): {self.YELLOW}1{self.NC} imagem")
+            lines.append("")
 
-        print(f"{self.CYAN}📂 Localização:{self.NC}")
+        lines.append(f"{self.CYAN}📂 Localização:{self.NC}")
         if self.generate_iphone:
-            print(f"   🍎 iPhone:      {self.YELLOW}{self.iphone_output_dir}{self.NC}")
+            lines.append(f"   🍎 iPhone:      {self.YELLOW}{self.iphone_output_dir}{self.NC}")
         if self.generate_ipad:
-            print(f"   🍎 iPad:        {self.YELLOW}{self.ipad_output_dir}{self.NC}")
+            lines.append(f"   🍎 iPad:        {self.YELLOW}{self.ipad_output_dir}{self.NC}")
         if self.generate_gplay:
-            print(f"   🤖 GPlay Phone: {self.YELLOW}{self.gplay_phone_output_dir}{self.NC}")
-            print(f"   🤖 GPlay Tablet:{self.YELLOW}{self.gplay_tablet_output_dir}{self.NC}")
+            lines.append(f"   🤖 GPlay Phone: {self.YELLOW}{self.gplay_phone_output_dir}{self.NC}")
+            lines.append(f"   🤖 GPlay Tablet:{self.YELLOW}{self.gplay_tablet_output_dir}{self.NC}")
             if self.generate_feature_graphic:
-                print(f"   📱 Feature:     {self.YELLOW}{self.feature_graphic_output_dir}{self.NC}")
+                lines.append(f"   📱 Feature:     {self.YELLOW}{self.feature_graphic_output_dir}{self.NC}")
 
-        print()
-        print(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print(f"{self.GREEN}✨ Mockups prontos para App Stores!{self.NC}")
-        print(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print()
+        lines.append("")
+        lines.append(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
+        lines.append(f"{self.GREEN}✨ Mockups prontos para App Stores!{self.NC}")
+        lines.append(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
+        lines.append("")
+        self._write_lines(lines)
 
     def generate(self) -> int:
         """
@@ -872,22 +1225,29 @@ class MockupGenerator:
             self._print_success(f"Encontrados {len(screenshots)} screenshots")
             print()
 
-            # Create output directories
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            # Create output directories once, up front: the per-screenshot workers
+            # and ImageMagickService write into them without checking they exist
+            output_dirs = [self.output_dir]
             if self.generate_iphone:
-                self.iphone_output_dir.mkdir(parents=True, exist_ok=True)
+                output_dirs.append(self.iphone_output_dir)
             if self.generate_ipad:
-                self.ipad_output_dir.mkdir(parents=True, exist_ok=True)
+                output_dirs.append(self.ipad_output_dir)
             if self.generate_gplay:
-                self.gplay_phone_output_dir.mkdir(parents=True, exist_ok=True)
-                self.gplay_tablet_output_dir.mkdir(parents=True, exist_ok=True)
+                output_dirs += [self.gplay_phone_output_dir, self.gplay_tablet_output_dir]
             if self.generate_feature_graphic:
-                self.feature_graphic_output_dir.mkdir(parents=True, exist_ok=True)
+                output_dirs.append(self.feature_graphic_output_dir)
+            if self.use_cache:
+                output_dirs.append(self.output_cache_dir)
+            for directory in output_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
 
             # Get user choices
             device_type, device_name, template_slug = self._prompt_device_choice()
             style_name, gradient_start, gradient_end = self._prompt_gradient_choice()
 
+            # Pre-render gradient backgrounds once per canvas size (shared by all screenshots)
+            self.imagemagick.prerender_gradients(gradient_start, gradient_end, self._gradient_sizes())
+
             # Ask if user wants to add logo
             add_logo = self._prompt_logo_choice()
 
@@ -900,62 +1260,98 @@ class MockupGenerator:
 
             # Print configuration
             self._print_section("✨ Gerando mockups para App Stores")
-            print(f"   Device Frame: {self.YELLOW}{device_name}{self.NC}")
-            print(f"   Cor: {self.YELLOW}{style_name}{self.NC}")
+            lines = [
+                f"   Device Frame: {self.YELLOW}{device_name}{self.NC}",
+                f"   Cor: {self.YELLOW}{style_name}{self.NC}",
+            ]
             if bottom_logo_path:
-                print(f"   Logo: {self.YELLOW}transparent-logo.png{self.NC} (bottom-right)")
+                lines.append(f"   Logo: {self.YELLOW}transparent-logo.png{self.NC} (bottom-right)")
             elif add_logo:
-                print(f"   Logo: {self.YELLOW}Não encontrada{self.NC}")
+                lines.append(f"   Logo: {self.YELLOW}Não encontrada{self.NC}")
             else:
-                print(f"   Logo: {self.YELLOW}Desabilitada{self.NC}")
-            print()
+                lines.append(f"   Logo: {self.YELLOW}Desabilitada{self.NC}")
+            lines.append("")
 
             # Show Apple App Store targets only if enabled
             if self.generate_iphone or self.generate_ipad:
-                print(f"   {self.CYAN}🍎 Apple App Store:{self.NC}")
+                lines.append(f"   {self.CYAN}🍎 Apple App Store:{self.NC}")
                 if self.generate_iphone:
-                    print(f"      iPhone 6.7\": 1290x2796 (cantos arredondados)")
+                    lines.append(f"      iPhone 6.7\": 1290x2796 (cantos arredondados)")
                 if self.generate_ipad:
-                    print(f"      iPad 12.9\": 2048x2732 (cantos arredondados)")
+                    lines.append(f"      iPad 12.9\": 2048x2732 (cantos arredondados)")
 
             # Show Google Play targets only if enabled
             if self.generate_gplay:
-                print()
-                print(f"   {self.CYAN}🤖 Google Play Store:{self.NC}")
-                print(f"      Phone: 1080x1920 (cantos arredondados)")
-                print(f"      Tablet 10\": 1600x2560 (cantos arredondados)")
-            print()
-
-            # Process screenshots
+                lines.append("")
+                lines.append(f"   {self.CYAN}🤖 Google Play Store:{self.NC}")
+                lines.append(f"      Phone: 1080x1920 (cantos arredondados)")
+                lines.append(f"      Tablet 10\": 1600x2560 (cantos arredondados)")
+            lines.append("")
+            self._write_lines(lines)
+
+            # Process screenshots in parallel (each one is independent)
             counts = {'iphone': 0, 'ipad': 0, 'gplay_phone': 0, 'gplay_tablet': 0, 'feature_graphic': 0}
-            for index, screenshot in enumerate(screenshots, start=1):
-                results = self._process_screenshot(
-                    screenshot_path=screenshot,
-                    device_type=device_type,
-                    template_slug=template_slug,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    index=index,
-                    total=len(screenshots),
-                    bottom_logo_path=bottom_logo_path
-                )
-                for key, success in results.items():
+            # One second of slack for filesystems with coarse timestamps
+            run_started = time.time() - 1
+            # Split the cores between workers and their magick subprocesses
+            cpu_count = os.cpu_count() or 1
+            workers = max(1, min(cpu_count, len(screenshots) + 1))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(max(1, cpu_count // workers),)
+            ) as executor:
+                # Feature Graphic only needs the home screenshot (first one) and the
+                # gradient, so submit it first and let it overlap the main loop
+                feature_future = None
+                if self.generate_feature_graphic and self.generate_gplay and screenshots:
+                    feature_future = executor.submit(
+                        _feature_graphic_job,
+                        self,
+                        dict(
+                            screenshot_path=screenshots[0],  # Usually 01_home.png
+                            gradient_start=gradient_start,
+                            gradient_end=gradient_end,
+                            logo_path=bottom_logo_path,
+                            text_lines=FeatureGraphicConfig.DEFAULT_TEXT_LINES
+                        )
+                    )
+
+                futures = [
+                    executor.submit(
+                        _process_screenshot_job,
+                        self,
+                        dict(
+                            screenshot_path=screenshot,
+                            device_type=device_type,
+                            template_slug=template_slug,
+                            gradient_start=gradient_start,
+                            gradient_end=gradient_end,
+                            index=index,
+                            total=len(screenshots),
+                            bottom_logo_path=bottom_logo_path
+                        )
+                    )
+                    for index, screenshot in enumerate(screenshots, start=1)
+                ]
+                # Collect in submission order so the log reads 1..N like a serial run
+                for future in futures:
+                    results, output = future.result()
+                    sys.stdout.write(output)
+                    for key, success in results.items():
+                        if success:
+                            counts[key] += 1
+
+                # Collect Feature Graphic (printed after the screenshots, as before)
+                if feature_future is not None:
+                    self._print_section("📱 Feature Graphic (Google Play)")
+                    success, output = feature_future.result()
+                    sys.stdout.write(output)
                     if success:
-                        counts[key] += 1
-
-            # Generate Feature Graphic (using first screenshot - home)
-            if self.generate_feature_graphic and self.generate_gplay and screenshots:
-                self._print_section("📱 Feature Graphic (Google Play)")
-                home_screenshot = screenshots[0]  # Usually 01_home.png
-                if self._generate_feature_graphic(
-                    screenshot_path=home_screenshot,
-                    gradient_start=gradient_start,
-                    gradient_end=gradient_end,
-                    logo_path=bottom_logo_path,
-                    text_lines=FeatureGraphicConfig.DEFAULT_TEXT_LINES
-                ):
-                    counts['feature_graphic'] = 1
-                print()
+                        counts['feature_graphic'] = 1
+                    print()
+
+            self._prune_output_cache(run_started)
 
             # Print summary
             self._print_summary(
@@ -991,6 +1387,63 @@ class MockupGenerator:
             self.logger.exception("Unexpected error during mockup generation")
             self._print_error(f"Erro inesperado: {e}")
             return 1
+        finally:
+            self.imagemagick.clear_prerendered_gradients()
+
+
+def _process_screenshot_job(generator: MockupGenerator, kwargs: dict) -> Tuple[dict, str]:
+    """
+    Worker entry point for the screenshot process pool
+
+    Runs MockupGenerator._process_screenshot and returns its console output
+    so the parent prints each screenshot's block whole, without interleaving.
+
+    Args:
+        generator: MockupGenerator (pickled into the worker)
+        kwargs: Keyword arguments for _process_screenshot
+
+    Returns:
+        Tuple (results dict, captured stdout)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        results = generator._process_screenshot(**kwargs)
+    return results, buffer.getvalue()
+
+
+def _feature_graphic_job(generator: MockupGenerator, kwargs: dict) -> Tuple[bool, str]:
+    """
+    Worker entry point for the Feature Graphic
+
+    Submitted to the same process pool as the screenshots so the banner
+    is rendered while the main loop runs.
+
+    Args:
+        generator: MockupGenerator (pickled into the worker)
+        kwargs: Keyword arguments for _generate_feature_graphic
+
+    Returns:
+        Tuple (success flag, captured stdout)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        success = generator._generate_feature_graphic(**kwargs)
+    return success, buffer.getvalue()
+
+
+def _init_worker(magick_threads: int) -> None:
+    """
+    Process pool initializer: cap ImageMagick's OpenMP threads per worker
+
+    Every worker runs its own magick subprocesses (curve overlays,
+    composites), so without a cap each one spawns a thread per core and
+    the pool oversubscribes the CPU. An explicit MAGICK_THREAD_LIMIT in the
+    environment is left untouched.
+
+    Args:
+        magick_threads: Threads each worker's magick calls may use
+    """
+    os.environ.setdefault('MAGICK_THREAD_LIMIT', str(magick_threads))
 
 
 def main() -> int:
@@ -11,7 +11,7 @@ import sys
 import os
 import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import logging
 import argparse
 
@@ -48,7 +48,9 @@ class ScreenshotPipeline:
         device_choice: Optional[int] = None,
         gradient_choice: Optional[int] = None,
         generate_ipad: Optional[bool] = None,
-        generate_gplay: Optional[bool] = None
+        generate_gplay: Optional[bool] = None,
+        add_logo: Optional[bool] = None,
+        use_cache: bool = True
     ):
         """
         Initialize screenshot pipeline
@@ -62,9 +64,15 @@ class ScreenshotPipeline:
             gradient_choice: Gradient style choice (0-6)
             generate_ipad: Whether to generate iPad screenshots (None = use project default)
             generate_gplay: Whether to generate Google Play screenshots (None = use project default)
+            add_logo: Whether to add the bottom logo to mockups (None = prompt)
+            use_cache: Reuse mockups rendered earlier from identical inputs
         """
         self.logger = logging.getLogger(__name__)
 
+        # No escape sequences when output goes to a file or CI log
+        if not sys.stdout.isatty():
+            self.RED = self.GREEN = self.YELLOW = self.BLUE = self.MAGENTA = self.CYAN = self.NC = ''
+
         # Use project config or create default (loyalty-app)
         self.project_config = project_config or LoyaltyAppConfig()
 
@@ -79,11 +87,9 @@ class ScreenshotPipeline:
             self.project_config.generate_gplay_phone or self.project_config.generate_gplay_tablet
         )
 
-        # Mockup configuration (via environment variables)
-        if device_choice is not None:
-            os.environ['DEVICE_CHOICE'] = str(device_choice)
-        if gradient_choice is not None:
-            os.environ['GRADIENT_CHOICE'] = str(gradient_choice)
+        # Mockup configuration (passed straight to MockupGenerator)
+        self.device_choice = device_choice
+        self.gradient_choice = gradient_choice
 
         # Load PRIMARY_COLOR from project config if gradient_choice is 0 (Client Primary)
         if gradient_choice == 0:
@@ -99,7 +105,11 @@ class ScreenshotPipeline:
         self.mockup_cmd = MockupGenerator(
             project_config=self.project_config,
             generate_ipad=self.generate_ipad,
-            generate_gplay=self.generate_gplay
+            generate_gplay=self.generate_gplay,
+            device_choice=device_choice,
+            gradient_choice=gradient_choice,
+            add_logo=add_logo,
+            use_cache=use_cache
         )
 
     def _load_primary_color_from_config(self) -> None:
@@ -117,24 +127,34 @@ class ScreenshotPipeline:
         else:
             self.logger.warning(f"Primary color not found for {self.project_config.project_name}")
 
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a block of lines to stdout in a single write"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def _print_banner(self) -> None:
         """Print pipeline banner"""
         project_name = self.project_config.project_name
-        print()
-        print(f"{self.MAGENTA}╔════════════════════════════════════════════╗{self.NC}")
-        print(f"{self.MAGENTA}║   📱  App Store Screenshot Pipeline  📱    ║{self.NC}")
-        print(f"{self.MAGENTA}║          Fully Automated Workflow          ║{self.NC}")
-        print(f"{self.MAGENTA}╚════════════════════════════════════════════╝{self.NC}")
-        print(f"{self.CYAN}   Project: {project_name}{self.NC}")
-        print()
+        self._write_lines([
+            "",
+            f"{self.MAGENTA}╔════════════════════════════════════════════╗{self.NC}",
+            f"{self.MAGENTA}║   📱  App Store Screenshot Pipeline  📱    ║{self.NC}",
+            f"{self.MAGENTA}║          Fully Automated Workflow          ║{self.NC}",
+            f"{self.MAGENTA}╚════════════════════════════════════════════╝{self.NC}",
+            f"{self.CYAN}   Project: {project_name}{self.NC}",
+            "",
+        ])
 
     def _print_section(self, title: str) -> None:
         """Print section header"""
-        print()
-        print(f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print(f"{self.BLUE}{title}{self.NC}")
-        print(f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print()
+        self._write_lines([
+            "",
+            f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}",
+            f"{self.BLUE}{title}{self.NC}",
+            f"{self.BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}",
+            "",
+        ])
 
     def _print_success(self, message: str) -> None:
         """Print success message"""
@@ -150,22 +170,24 @@ class ScreenshotPipeline:
 
     def _print_configuration(self) -> None:
         """Print pipeline configuration"""
-        print(f"{self.CYAN}⚙️  Configuração:{self.NC}")
-        print(f"   Device: {self.YELLOW}{self.device}{self.NC}")
-        print(f"   Platform: {self.YELLOW}{self.platform}{self.NC}")
-        print(f"   Skip Tests: {self.YELLOW}{self.skip_tests}{self.NC}")
-
-        # Print mockup choices if set via environment
-        device_choice = os.getenv('DEVICE_CHOICE')
-        gradient_choice = os.getenv('GRADIENT_CHOICE')
-
-        if device_choice or gradient_choice:
-            print()
-            print(f"{self.CYAN}🎨 Mockup (automático):{self.NC}")
-            if device_choice:
-                print(f"   Device Choice: {self.YELLOW}{device_choice}{self.NC}")
-            if gradient_choice:
-                print(f"   Gradient: {self.YELLOW}{gradient_choice}{self.NC}")
+        lines = []
+        lines.append(f"{self.CYAN}⚙️  Configuração:{self.NC}")
+        lines.append(f"   Device: {self.YELLOW}{self.device}{self.NC}")
+        lines.append(f"   Platform: {self.YELLOW}{self.platform}{self.NC}")
+        lines.append(f"   Skip Tests: {self.YELLOW}{self.skip_tests}{self.NC}")
+
+        # Print mockup choices if set (arguments win over environment)
+        device_choice = self.device_choice if self.device_choice is not None else os.getenv('DEVICE_CHOICE')
+        gradient_choice = self.gradient_choice if self.gradient_choice is not None else os.getenv('GRADIENT_CHOICE')
+
+        if device_choice is not None or gradient_choice is not None:
+            lines.append("")
+            lines.append(f"{self.CYAN}🎨 Mockup (automático):{self.NC}")
+            if device_choice is not None:
+                lines.append(f"   Device Choice: {self.YELLOW}{device_choice}{self.NC}")
+            if gradient_choice is not None:
+                lines.append(f"   Gradient: {self.YELLOW}{gradient_choice}{self.NC}")
+        self._write_lines(lines)
 
     def _print_final_summary(
         self,
@@ -176,28 +198,51 @@ class ScreenshotPipeline:
         screenshots_dir = self.capture_cmd.screenshots_dir
         mockups_dir = self.capture_cmd.mockups_dir
 
-        print()
-        print(f"{self.MAGENTA}╔════════════════════════════════════════════╗{self.NC}")
-        print(f"{self.MAGENTA}║          ✅  PROCESSO CONCLUÍDO  ✅         ║{self.NC}")
-        print(f"{self.MAGENTA}╚════════════════════════════════════════════╝{self.NC}")
-        print()
-
-        print(f"{self.CYAN}📊 Resumo:{self.NC}")
-        print(f"   {self.GREEN}✅{self.NC} Screenshots originais: {self.YELLOW}{screenshot_count}{self.NC}")
-        print(f"   {self.GREEN}✅{self.NC} Mockups gerados: {self.YELLOW}{mockup_count}{self.NC}")
-        print(f"   {self.GREEN}✅{self.NC} Platform: {self.YELLOW}{self.platform}{self.NC}")
-        print(f"   {self.GREEN}✅{self.NC} Device: {self.YELLOW}{self.device}{self.NC}")
-        print()
-
-        print(f"{self.CYAN}📂 Localização:{self.NC}")
-        print(f"   Screenshots: {self.YELLOW}{screenshots_dir}{self.NC}")
-        print(f"   Mockups:     {self.YELLOW}{mockups_dir}{self.NC}")
-        print()
-
-        print(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print(f"{self.GREEN}🎉 Screenshots prontos para App Stores!{self.NC}")
-        print(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
-        print()
+        lines = []
+        lines.append("")
+        lines.append(f"{self.MAGENTA}╔════════════════════════════════════════════╗{self.NC}")
+        lines.append(f"{self.MAGENTA}║          ✅  PROCESSO CONCLUÍDO  ✅         ║{self.NC}")
+        lines.append(f"{self.MAGENTA}╚════════════════════════════════════════════╝{self.NC}")
+        lines.append("")
+
+        lines.append(f"{self.CYAN}📊 Resumo:{self.NC}")
+        lines.append(f"   {self.GREEN}✅{self.NC} Screenshots originais: {self.YELLOW}{screenshot_count}{self.NC}")
+        lines.append(f"   {self.GREEN}✅{self.NC} Mockups gerados: {self.YELLOW}{mockup_count}{self.NC}")
+        lines.append(f"   {self.GREEN}✅{self.NC} Platform: {self.YELLOW}{self.platform}{self.NC}")
+        lines.append(f"   {self.GREEN}✅{self.NC} Device: {self.YELLOW}{self.device}{self.NC}")
+        lines.append("")
+
+        lines.append(f"{self.CYAN}📂 Localização:{self.NC}")
+        lines.append(f"   Screenshots: {self.YELLOW}{screenshots_dir}{self.NC}")
+        lines.append(f"   Mockups:     {self.YELLOW}{mockups_dir}{self.NC}")
+        lines.append("")
+
+        lines.append(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
+        lines.append(f"{self.GREEN}🎉 Screenshots prontos para App Stores!{self.NC}")
+        lines.append(f"{self.GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.NC}")
+        lines.append("")
+        self._write_lines(lines)
+
+    @staticmethod
+    def _count_files(directory: Path, suffix: str) -> int:
+        """
+        Count files in a directory whose name ends with suffix
+
+        Single os.scandir pass (no sorting, no Path objects).
+
+        Args:
+            directory: Directory to scan
+            suffix: File name suffix to match
+
+        Returns:
+            Number of matching files (0 if the directory does not exist)
+        """
+        # Guard clause: Nothing generated yet
+        if not directory.is_dir():
+            return 0
+
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(suffix) and entry.is_file())
 
     def run(self) -> int:
         """
@@ -220,8 +265,7 @@ class ScreenshotPipeline:
                 raise PipelineError("Screenshot capture failed")
 
             # Count screenshots
-            screenshots = sorted(self.capture_cmd.screenshots_dir.glob("0*.png"))
-            screenshot_count = len(screenshots)
+            screenshot_count = len(self.capture_cmd._scan_screenshots())
 
             # Step 2: Generate mockups
             self._print_section("🎯 ETAPA 2/2: Geração de Mockups")
@@ -232,8 +276,7 @@ class ScreenshotPipeline:
                 raise PipelineError("Mockup generation failed")
 
             # Count mockups
-            mockups = sorted(self.capture_cmd.mockups_dir.glob("*_3d.png"))
-            mockup_count = len(mockups)
+            mockup_count = self._count_files(self.capture_cmd.mockups_dir, suffix="_3d.png")
 
             # Print final summary
             self._print_final_summary(screenshot_count, mockup_count)
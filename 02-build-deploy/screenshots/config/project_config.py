@@ -17,11 +17,31 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+import json
 import os
 
 
+# Resolved once at import (resolve() costs a realpath per call)
+# config -> screenshots -> 02-build-deploy -> loyalty-composer -> repo_root
+_MODULE_DIR = Path(__file__).resolve().parent
+_REPO_ROOT_DEFAULT = _MODULE_DIR.parent.parent.parent.parent
+_TEMPLATES_DIR = _MODULE_DIR.parent / "mockupgen_templates"
+
+
+@lru_cache(maxsize=4)
+def _load_config_json(path: str, mtime_ns: int) -> dict:
+    """
+    Parse a config.json, memoized by (path, mtime).
+
+    The mtime is part of the key so an edited file is parsed again.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class ProjectConfig(ABC):
     """
     Abstract base class for project-specific configurations.
@@ -39,8 +59,8 @@ class ProjectConfig(ABC):
             repo_root: Repository root path. Auto-detected if not provided.
         """
         if repo_root is None:
-            # Auto-detect: config -> screenshots -> 02-build-deploy -> loyalty-composer -> repo_root
-            self._repo_root = Path(__file__).resolve().parent.parent.parent.parent.parent
+            # Auto-detect: see _REPO_ROOT_DEFAULT
+            self._repo_root = _REPO_ROOT_DEFAULT
         else:
             self._repo_root = repo_root
 
@@ -141,9 +161,7 @@ class ProjectConfig(ABC):
             return None
 
         try:
-            import json
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_config_json(str(config_path), config_path.stat().st_mtime_ns)
             return config.get('colors', {}).get('primary')
         except (json.JSONDecodeError, IOError):
             return None
@@ -198,8 +216,7 @@ class LoyaltyAppConfig(ProjectConfig):
     @property
     def top_images_dir(self) -> Optional[Path]:
         # Top images are in the mockupgen_templates directory
-        templates_dir = Path(__file__).resolve().parent.parent / "mockupgen_templates"
-        return templates_dir / "top_images"
+        return _TEMPLATES_DIR / "top_images"
 
     @property
     def config_json_path(self) -> Optional[Path]:
@@ -279,8 +296,7 @@ class LoyaltyAdminConfig(ProjectConfig):
         if top_dir.exists():
             return top_dir
         # Fallback to shared templates
-        templates_dir = Path(__file__).resolve().parent.parent / "mockupgen_templates"
-        return templates_dir / "top_images"
+        return _TEMPLATES_DIR / "top_images"
 
     @property
     def config_json_path(self) -> Optional[Path]:
@@ -359,6 +375,17 @@ def get_project_config(project_slug: str, repo_root: Optional[Path] = None) -> P
     return config_class(repo_root=repo_root)
 
 
+@lru_cache(maxsize=1)
+def _available_projects() -> tuple:
+    """(slug, name) pairs for PROJECT_CONFIGS, built once"""
+    result = []
+    for slug, config_class in PROJECT_CONFIGS.items():
+        # Create temporary instance to get name
+        config = config_class()
+        result.append((slug, config.project_name))
+    return tuple(result)
+
+
 def list_available_projects() -> list:
     """
     List all available project configurations.
@@ -366,9 +393,4 @@ def list_available_projects() -> list:
     Returns:
         List of tuples (slug, name) for each project
     """
-    result = []
-    for slug, config_class in PROJECT_CONFIGS.items():
-        # Create temporary instance to get name
-        config = config_class()
-        result.append((slug, config.project_name))
-    return result
+    return list(_available_projects())
@@ -11,34 +11,55 @@ Usage:
     radius = ScreenshotConfig.MIN_CORNER_RADIUS
 """
 
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # typing.Final is 3.8+; annotations are never evaluated at runtime here
+    from typing import Final
+
+# Slotted dataclasses need Python 3.10+; older interpreters (3.7+ supported)
+# still get frozen, hashable configs
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Classes below that declare an empty __slots__ are constant namespaces:
+# they are never instantiated, only read as ClassName.CONSTANT. (The
+# Device*Config dataclasses are the per-device instances.)
+
 
 class ScreenshotConfig:
     """Configuration constants for screenshot processing"""
 
+    __slots__ = ()
+
     # ==================================
     # IMAGE PROCESSING
     # ==================================
 
     # Minimum corner radius to apply (pixels)
-    MIN_CORNER_RADIUS = 2
+    MIN_CORNER_RADIUS: Final = 2
 
     # Gaussian blur kernel size for smooth corners
-    BLUR_KERNEL_SIZE = (5, 5)
-    BLUR_SIGMA = 0
+    BLUR_KERNEL_SIZE: Final = (5, 5)
+    BLUR_SIGMA: Final = 0
 
     # ==================================
     # CORNER RADIUS DETECTION
     # ==================================
 
     # Maximum pixels to search for corner radius
-    CORNER_SEARCH_MAX_PIXELS = 200
+    CORNER_SEARCH_MAX_PIXELS: Final = 200
 
     # Divisor for calculating max search based on screen width
-    CORNER_SEARCH_WIDTH_DIVISOR = 4
+    CORNER_SEARCH_WIDTH_DIVISOR: Final = 4
 
     # Default corner radius as percentage of min(width, height)
     # iPhone 15 Pro Max: ~3.6% of screen dimension
-    DEFAULT_CORNER_RADIUS_PERCENT = 0.036
+    DEFAULT_CORNER_RADIUS_PERCENT: Final = 0.036
 
     # ==================================
     # SAFETY MARGINS
@@ -46,37 +67,51 @@ class ScreenshotConfig:
 
     # Safety margin to prevent edge bleeding (pixels)
     # Prevents interpolation artifacts from 3D transformation
-    SAFETY_MARGIN_PIXELS = 20
+    SAFETY_MARGIN_PIXELS: Final = 20
 
     # ==================================
     # INTERPOLATION
     # ==================================
 
     # OpenCV interpolation method for high-quality resizing
-    INTERPOLATION_METHOD = 'LANCZOS4'
+    INTERPOLATION_METHOD: Final = 'LANCZOS4'
+
+    # OpenCV interpolation method for downscaling (pixel-area resampling:
+    # no aliasing and faster than Lanczos when shrinking)
+    DOWNSCALE_INTERPOLATION_METHOD: Final = 'AREA'
 
     # Border mode for perspective transformation
-    BORDER_MODE = 'CONSTANT'
+    BORDER_MODE: Final = 'CONSTANT'
 
     # Border value for transparent areas (BGRA)
-    BORDER_VALUE = (0, 0, 0, 0)
+    BORDER_VALUE: Final = (0, 0, 0, 0)
 
     # ==================================
     # MASKING
     # ==================================
 
     # Alpha threshold for opacity detection
-    ALPHA_THRESHOLD_TRANSPARENT = 0
-    ALPHA_THRESHOLD_OPAQUE = 0
+    ALPHA_THRESHOLD_TRANSPARENT: Final = 0
+    ALPHA_THRESHOLD_OPAQUE: Final = 0
 
     # Mask values
-    MASK_VALUE_ALLOW = 255
-    MASK_VALUE_BLOCK = 0
+    MASK_VALUE_ALLOW: Final = 255
+    MASK_VALUE_BLOCK: Final = 0
+
+    # ==================================
+    # INTERMEDIATE OUTPUT
+    # ==================================
+
+    # PNG compression level (0-9) for the flat mockup written by apply_mockup.py.
+    # It is read back by ImageMagick right away, so favor encode speed over size.
+    INTERMEDIATE_PNG_COMPRESSION: Final = 1
 
 
 class MockupConfig:
     """Configuration constants for mockup generation"""
 
+    __slots__ = ()
+
     # ==================================
     # CANVAS DIMENSIONS
     # ==================================
@@ -126,6 +161,16 @@ class MockupConfig:
     # PNG compression level (0-9, where 9 is highest compression)
     PNG_COMPRESSION_LEVEL = 9
 
+    # zlib level for PNGs written by ImageMagick (intermediates and final outputs).
+    # Level 6 stays close to level 9 in size at a fraction of the encode time.
+    MAGICK_PNG_COMPRESSION_LEVEL = 6
+
+    # ImageMagick resource limits per command. Pixels beyond the area limit are
+    # paged to ImageMagick's disk cache, which bounds peak RAM when several
+    # process-pool workers run magick at once.
+    MAGICK_AREA_LIMIT = "256MB"
+    MAGICK_MEMORY_LIMIT = "1GB"
+
     # JPEG quality (0-100, where 100 is highest quality)
     JPEG_QUALITY = 95
 
@@ -133,6 +178,8 @@ class MockupConfig:
 class DeviceConfig:
     """Device-specific configuration"""
 
+    __slots__ = ()
+
     # ==================================
     # IPHONE 15 PRO MAX
     # ==================================
@@ -202,6 +249,8 @@ class AppleStoreConfig:
     - APP_IPAD_PRO_129 (12.9"): 2048x2732 (iPad Pro 12.9")
     """
 
+    __slots__ = ()
+
     # ==================================
     # IPHONE 6.7" (Mandatory - largest iPhone)
     # Fastlane folder: APP_IPHONE_67
@@ -267,6 +316,8 @@ class AppleStoreConfig:
 class GooglePlayConfig:
     """Google Play Store screenshot requirements (2025)"""
 
+    __slots__ = ()
+
     # ==================================
     # PHONE (9:16 portrait)
     # ==================================
@@ -318,6 +369,8 @@ class FeatureGraphicConfig:
     └──────────────────────────────────────────────────────────────┘
     """
 
+    __slots__ = ()
+
     # ==================================
     # DIMENSIONS (Google Play requirement)
     # ==================================
@@ -400,6 +453,8 @@ class LayoutConfig:
     └────────────────────────┘
     """
 
+    __slots__ = ()
+
     # ==================================
     # VERTICAL POSITIONING (asymmetric)
     # ==================================
@@ -423,18 +478,22 @@ class LayoutConfig:
     # ==================================
     # HELPER METHODS
     # ==================================
+    # Memoized per canvas size: only a handful of target resolutions exist
 
     @classmethod
+    @lru_cache(maxsize=16)
     def get_top_offset(cls, canvas_height: int) -> int:
         """Calculate top offset in pixels for a given canvas height"""
         return int(canvas_height * cls.TOP_SPACE_PERCENT)
 
     @classmethod
+    @lru_cache(maxsize=16)
     def get_mockup_max_height(cls, canvas_height: int) -> int:
         """Calculate maximum mockup height in pixels"""
         return int(canvas_height * cls.MOCKUP_SPACE_PERCENT)
 
     @classmethod
+    @lru_cache(maxsize=16)
     def get_mockup_max_width(cls, canvas_width: int) -> int:
         """Calculate maximum mockup width in pixels (accounting for horizontal padding)"""
         return int(canvas_width * (1 - 2 * cls.HORIZONTAL_PADDING_PERCENT))
@@ -460,6 +519,8 @@ class DecorativeCurvesConfig:
     └────────────────────────────────────┘
     """
 
+    __slots__ = ()
+
     # ==================================
     # COLOR ADJUSTMENT
     # ==================================
@@ -506,10 +567,7 @@ class DecorativeCurvesConfig:
     CURVE_OPACITY = 1.0
 
 
-from dataclasses import dataclass
-
-
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DeviceTopImageConfig:
     """Configuration for top image placement on a specific device type.
 
@@ -539,6 +597,8 @@ class TopImageConfig:
     device-specific settings to ensure images fit properly.
     """
 
+    __slots__ = ()
+
     # iPhone 6.9" - tall device (aspect ratio 0.46), works well with larger images
     # Top image uses 100% width for full visual impact
     IPHONE = DeviceTopImageConfig(
@@ -578,16 +638,19 @@ class TopImageConfig:
         Returns:
             DeviceTopImageConfig for the device (defaults to IPHONE if unknown)
         """
-        configs = {
-            'iphone': cls.IPHONE,
-            'ipad': cls.IPAD,
-            'gplay_phone': cls.GPLAY_PHONE,
-            'gplay_tablet': cls.GPLAY_TABLET,
-        }
-        return configs.get(device_type, cls.IPHONE)
+        return cls._CONFIGS.get(device_type, cls.IPHONE)
+
 
+# device_type -> config, built once (get_config is called per composite)
+TopImageConfig._CONFIGS = {
+    'iphone': TopImageConfig.IPHONE,
+    'ipad': TopImageConfig.IPAD,
+    'gplay_phone': TopImageConfig.GPLAY_PHONE,
+    'gplay_tablet': TopImageConfig.GPLAY_TABLET,
+}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DeviceBottomLogoConfig:
     """Configuration for bottom-right logo placement on a specific device type.
 
@@ -619,6 +682,8 @@ class BottomLogoConfig:
     GPlay Phone needs more restrictive settings to prevent overlap.
     """
 
+    __slots__ = ()
+
     # iPhone 6.7" - 280px bottom space, plenty of room - LARGER logo
     IPHONE = DeviceBottomLogoConfig(
         max_width_percent=0.30,
@@ -661,18 +726,23 @@ class BottomLogoConfig:
         Returns:
             DeviceBottomLogoConfig for the device (defaults to IPHONE if unknown)
         """
-        configs = {
-            'iphone': cls.IPHONE,
-            'ipad': cls.IPAD,
-            'gplay_phone': cls.GPLAY_PHONE,
-            'gplay_tablet': cls.GPLAY_TABLET,
-        }
-        return configs.get(device_type, cls.IPHONE)
+        return cls._CONFIGS.get(device_type, cls.IPHONE)
+
+
+# device_type -> config, built once (get_config is called per composite)
+BottomLogoConfig._CONFIGS = {
+    'iphone': BottomLogoConfig.IPHONE,
+    'ipad': BottomLogoConfig.IPAD,
+    'gplay_phone': BottomLogoConfig.GPLAY_PHONE,
+    'gplay_tablet': BottomLogoConfig.GPLAY_TABLET,
+}
 
 
 class PathConfig:
     """Path configuration"""
 
+    __slots__ = ()
+
     # ==================================
     # DIRECTORY PATHS
     # ==================================
@@ -692,13 +762,19 @@ class PathConfig:
 
 
 # Convenience function for getting OpenCV interpolation constant
-def get_interpolation_method():
-    """Returns OpenCV interpolation method constant"""
+# (memoized: the config is constant at runtime, so cv2 is looked up once per flag)
+@lru_cache(maxsize=2)
+def get_interpolation_method(downscale=False):
+    """Returns OpenCV interpolation method constant (downscale: shrinking image)"""
     import cv2
-    method_name = ScreenshotConfig.INTERPOLATION_METHOD
+    if downscale:
+        method_name = ScreenshotConfig.DOWNSCALE_INTERPOLATION_METHOD
+    else:
+        method_name = ScreenshotConfig.INTERPOLATION_METHOD
     return getattr(cv2, f'INTER_{method_name}')
 
 
+@lru_cache(maxsize=1)
 def get_border_mode():
     """Returns OpenCV border mode constant"""
     import cv2
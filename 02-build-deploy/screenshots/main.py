@@ -20,13 +20,17 @@ import os
 import argparse
 import logging
 from pathlib import Path
+from typing import List, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(__file__))
+# Add this directory to path for imports. Running `python3 main.py` already
+# puts it first on sys.path, so only insert it when imported from elsewhere
+# (a duplicate entry costs an extra path-finder directory scan per import).
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
 
-from commands.capture import ScreenshotCapture, main as capture_main
-from commands.generate_mockups import MockupGenerator, main as mockups_main
-from commands.pipeline import ScreenshotPipeline, main as pipeline_main
+# commands.* are imported inside the cmd_* handlers so each run only loads
+# the subcommand it executes (generate_mockups pulls in the image stack)
 from config.project_config import get_project_config, list_available_projects, PROJECT_CONFIGS
 
 
@@ -37,23 +41,16 @@ YELLOW = '\033[1;33m'
 GREEN = '\033[0;32m'
 NC = '\033[0m'
 
+# Mirrors ScreenshotCapture.DEFAULT_DEVICE / DEFAULT_PLATFORM, kept here so
+# building the parser doesn't import commands.capture
+DEFAULT_DEVICE = "iPhone 15 Pro Max"
+DEFAULT_PLATFORM = "ios"
 
-def print_banner() -> None:
-    """Print CLI banner"""
-    print()
-    print(f"{MAGENTA}╔════════════════════════════════════════════╗{NC}")
-    print(f"{MAGENTA}║     📱  Screenshot Automation CLI  📱     ║{NC}")
-    print(f"{MAGENTA}║        Python + OpenCV + ImageMagick       ║{NC}")
-    print(f"{MAGENTA}╚════════════════════════════════════════════╝{NC}")
-    print()
+VERBOSE_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create argument parser with subcommands"""
-    parser = argparse.ArgumentParser(
-        description="Screenshot automation CLI for Flutter apps",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help epilogs, only attached to the parser when help is requested
+_ROOT_EPILOG = """
 Commands:
   capture   Capture screenshots via Flutter integration tests
   mockups   Generate mockups from screenshots
@@ -74,6 +71,93 @@ For command-specific help:
   %(prog)s mockups --help
   %(prog)s pipeline --help
         """
+
+_CAPTURE_EPILOG = """
+Examples:
+  # Capture iOS screenshots:
+  %(prog)s --device "iPhone 15 Pro Max" --platform ios
+
+  # Capture Android screenshots:
+  %(prog)s --platform android
+
+  # Skip test execution:
+  %(prog)s --skip-tests
+        """
+
+_MOCKUPS_EPILOG = """
+Examples:
+  # Interactive mode (prompts for choices):
+  %(prog)s
+
+  # Automated mode:
+  %(prog)s --device-choice 1 --gradient-choice 0
+
+Device Choices:
+  1 - iPhone 15 Pro Max
+  2 - Pixel 8 Pro
+
+Gradient Choices:
+  0 - Client Primary (from config.json)
+  1 - Premium Purple/Pink
+  2 - Ocean Blue
+  3 - Sunset Orange
+  4 - Fresh Green
+  5 - Dark Purple
+  6 - Bold Red/Pink
+        """
+
+_PIPELINE_EPILOG = """
+Examples:
+  # Interactive mode:
+  %(prog)s
+
+  # Fully automated:
+  %(prog)s --device-choice 1 --gradient-choice 0
+
+  # Skip tests + automated mockups:
+  %(prog)s --skip-tests --device-choice 1 --gradient-choice 0
+
+  # Android workflow:
+  %(prog)s --platform android --device-choice 2
+        """
+
+
+# Assembled once; print_banner() emits it with a single write
+_BANNER = "\n".join([
+    "",
+    f"{MAGENTA}╔════════════════════════════════════════════╗{NC}",
+    f"{MAGENTA}║     📱  Screenshot Automation CLI  📱     ║{NC}",
+    f"{MAGENTA}║        Python + OpenCV + ImageMagick       ║{NC}",
+    f"{MAGENTA}╚════════════════════════════════════════════╝{NC}",
+    "",
+    "",
+])
+
+
+def print_banner() -> None:
+    """Print CLI banner"""
+    sys.stdout.write(_BANNER)
+
+
+def create_parser(
+    command: Optional[str] = None,
+    with_epilogs: bool = True
+) -> argparse.ArgumentParser:
+    """
+    Create argument parser with subcommands.
+
+    Args:
+        command: Only build this subcommand's parser. None builds all of
+                 them (used for top-level help and unknown commands).
+        with_epilogs: Attach the example epilogs (only needed for --help)
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Screenshot automation CLI for Flutter apps",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_ROOT_EPILOG if with_epilogs else None
     )
 
     # Global options
@@ -105,146 +189,106 @@ For command-specific help:
         required=True
     )
 
-    # =====================================
-    # CAPTURE SUBCOMMAND
-    # =====================================
-    capture_parser = subparsers.add_parser(
-        'capture',
-        help='Capture screenshots via Flutter integration tests',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        description='Capture app screenshots using Flutter integration tests',
-        epilog="""
-Examples:
-  # Capture iOS screenshots:
-  %(prog)s --device "iPhone 15 Pro Max" --platform ios
+    for name, add_subparser in SUBCOMMANDS.items():
+        if command is None or name == command:
+            add_subparser(subparsers, with_epilogs)
 
-  # Capture Android screenshots:
-  %(prog)s --platform android
+    return parser
 
-  # Skip test execution:
-  %(prog)s --skip-tests
-        """
-    )
 
-    capture_parser.add_argument(
+def _detect_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand in argv without building the parser.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Subcommand name, or None if top-level help was requested or
+        no known subcommand is present
+    """
+    for arg in argv:
+        if arg in SUBCOMMANDS:
+            return arg
+        # Guard clause: help before the subcommand lists every command
+        if arg in ('-h', '--help'):
+            return None
+    return None
+
+
+def _add_capture_args(parser: argparse._ActionsContainer) -> None:
+    """
+    Add the capture options shared by the capture and pipeline subcommands.
+
+    Args:
+        parser: ArgumentParser or argument group to add the options to
+    """
+    parser.add_argument(
         '--device',
-        default=ScreenshotCapture.DEFAULT_DEVICE,
-        help=f'Device name (default: {ScreenshotCapture.DEFAULT_DEVICE})'
+        default=DEFAULT_DEVICE,
+        help=f'Device name (default: {DEFAULT_DEVICE})'
     )
 
-    capture_parser.add_argument(
+    parser.add_argument(
         '--platform',
         choices=['ios', 'android'],
-        default=ScreenshotCapture.DEFAULT_PLATFORM,
-        help=f'Platform (default: {ScreenshotCapture.DEFAULT_PLATFORM})'
+        default=DEFAULT_PLATFORM,
+        help=f'Platform (default: {DEFAULT_PLATFORM})'
     )
 
-    capture_parser.add_argument(
+    parser.add_argument(
         '--skip-tests',
         action='store_true',
         help='Skip test execution (use existing screenshots)'
     )
 
-    capture_parser.add_argument(
-        '--screenshots-dir',
-        type=Path,
-        help='Screenshots directory'
-    )
 
-    capture_parser.add_argument(
-        '--white-label-dir',
-        type=Path,
-        help='Flutter project directory'
-    )
+def _add_mockup_args(parser: argparse._ActionsContainer) -> None:
+    """
+    Add the mockup options shared by the mockups and pipeline subcommands.
 
-    # =====================================
-    # MOCKUPS SUBCOMMAND
-    # =====================================
-    mockups_parser = subparsers.add_parser(
-        'mockups',
-        help='Generate mockups from screenshots',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        description='Generate mockups with gradient backgrounds',
-        epilog="""
-Examples:
-  # Interactive mode (prompts for choices):
-  %(prog)s
-
-  # Automated mode:
-  %(prog)s --device-choice 1 --gradient-choice 0
-
-Device Choices:
-  1 - iPhone 15 Pro Max
-  2 - Pixel 8 Pro
-
-Gradient Choices:
-  0 - Client Primary (from config.json)
-  1 - Premium Purple/Pink
-  2 - Ocean Blue
-  3 - Sunset Orange
-  4 - Fresh Green
-  5 - Dark Purple
-  6 - Bold Red/Pink
-        """
-    )
-
-    mockups_parser.add_argument(
+    Args:
+        parser: ArgumentParser or argument group to add the options to
+    """
+    parser.add_argument(
         '--device-choice',
         type=int,
         choices=[1, 2],
         help='Device: 1=iPhone 15 Pro Max, 2=Pixel 8 Pro'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--gradient-choice',
         type=int,
         choices=[0, 1, 2, 3, 4, 5, 6],
         help='Gradient: 0=Client Primary, 1=Purple, 2=Blue, 3=Orange, 4=Green, 5=Dark, 6=Red'
     )
 
-    mockups_parser.add_argument(
-        '--screenshots-dir',
-        type=Path,
-        help='Screenshots directory'
-    )
-
-    mockups_parser.add_argument(
-        '--output-dir',
-        type=Path,
-        help='Output directory for mockups'
-    )
-
-    mockups_parser.add_argument(
-        '--templates-dir',
-        type=Path,
-        help='Device templates directory'
-    )
-
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--no-ipad',
         action='store_true',
         help='Skip iPad screenshot generation'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--no-gplay',
         action='store_true',
         help='Skip Google Play screenshot generation'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--apple-only',
         action='store_true',
         help='Generate only Apple App Store screenshots (same as --no-gplay)'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--gplay-only',
         action='store_true',
         help='Generate only Google Play Store screenshots (same as --no-ipad)'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--with-logo',
         action='store_true',
         dest='add_logo',
@@ -252,70 +296,109 @@ Gradient Choices:
         help='Add transparent-logo.png to bottom-right of mockups'
     )
 
-    mockups_parser.add_argument(
+    parser.add_argument(
         '--no-logo',
         action='store_false',
         dest='add_logo',
         help='Skip adding logo to mockups'
     )
 
-    # =====================================
-    # PIPELINE SUBCOMMAND
-    # =====================================
-    pipeline_parser = subparsers.add_parser(
-        'pipeline',
-        help='Run complete workflow (capture + mockups)',
+
+def _add_capture_parser(
+    subparsers: argparse._SubParsersAction,
+    with_epilogs: bool
+) -> None:
+    """Add the capture subcommand"""
+    capture_parser = subparsers.add_parser(
+        'capture',
+        help='Capture screenshots via Flutter integration tests',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description='Complete screenshot automation pipeline',
-        epilog="""
-Examples:
-  # Interactive mode:
-  %(prog)s
+        description='Capture app screenshots using Flutter integration tests',
+        epilog=_CAPTURE_EPILOG if with_epilogs else None
+    )
 
-  # Fully automated:
-  %(prog)s --device-choice 1 --gradient-choice 0
+    _add_capture_args(capture_parser)
 
-  # Skip tests + automated mockups:
-  %(prog)s --skip-tests --device-choice 1 --gradient-choice 0
+    capture_parser.add_argument(
+        '--screenshots-dir',
+        type=Path,
+        help='Screenshots directory'
+    )
 
-  # Android workflow:
-  %(prog)s --platform android --device-choice 2
-        """
+    capture_parser.add_argument(
+        '--white-label-dir',
+        type=Path,
+        help='Flutter project directory'
     )
 
-    # Capture options
-    capture_group = pipeline_parser.add_argument_group('Screenshot Capture')
-    capture_group.add_argument(
-        '--device',
-        default="iPhone 15 Pro Max",
-        help='iOS device name'
+
+def _add_mockups_parser(
+    subparsers: argparse._SubParsersAction,
+    with_epilogs: bool
+) -> None:
+    """Add the mockups subcommand"""
+    mockups_parser = subparsers.add_parser(
+        'mockups',
+        help='Generate mockups from screenshots',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description='Generate mockups with gradient backgrounds',
+        epilog=_MOCKUPS_EPILOG if with_epilogs else None
     )
-    capture_group.add_argument(
-        '--platform',
-        choices=['ios', 'android'],
-        default='ios',
-        help='Platform (default: ios)'
+
+    _add_mockup_args(mockups_parser)
+
+    mockups_parser.add_argument(
+        '--screenshots-dir',
+        type=Path,
+        help='Screenshots directory'
     )
-    capture_group.add_argument(
-        '--skip-tests',
+
+    mockups_parser.add_argument(
+        '--output-dir',
+        type=Path,
+        help='Output directory for mockups'
+    )
+
+    mockups_parser.add_argument(
+        '--templates-dir',
+        type=Path,
+        help='Device templates directory'
+    )
+
+    mockups_parser.add_argument(
+        '--isolate',
         action='store_true',
-        help='Skip test execution'
+        help='Run apply_mockup.py as a separate process per screenshot (debugging)'
     )
 
-    # Mockup options
-    mockup_group = pipeline_parser.add_argument_group('Mockup Generation')
-    mockup_group.add_argument(
-        '--device-choice',
-        type=int,
-        choices=[1, 2],
-        help='1=iPhone 15 Pro Max, 2=Pixel 8 Pro'
+    mockups_parser.add_argument(
+        '--no-cache',
+        action='store_false',
+        dest='use_cache',
+        help='Re-render every mockup instead of reusing unchanged ones'
     )
-    mockup_group.add_argument(
-        '--gradient-choice',
-        type=int,
-        choices=[0, 1, 2, 3, 4, 5, 6],
-        help='0=Client Primary, 1=Purple, 2=Blue, 3=Orange, 4=Green, 5=Dark, 6=Red'
+
+
+def _add_pipeline_parser(
+    subparsers: argparse._SubParsersAction,
+    with_epilogs: bool
+) -> None:
+    """Add the pipeline subcommand"""
+    pipeline_parser = subparsers.add_parser(
+        'pipeline',
+        help='Run complete workflow (capture + mockups)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description='Complete screenshot automation pipeline',
+        epilog=_PIPELINE_EPILOG if with_epilogs else None
     )
+
+    # Capture options
+    capture_group = pipeline_parser.add_argument_group('Screenshot Capture')
+    _add_capture_args(capture_group)
+
+    # Mockup options
+    mockup_group = pipeline_parser.add_argument_group('Mockup Generation')
+    _add_mockup_args(mockup_group)
     mockup_group.add_argument(
         '--angle-choice',
         type=int,
@@ -323,46 +406,25 @@ Examples:
         help='Rotation angle: 1=Subtle (15°), 2=Moderate (20°), 3=Pronounced (25°) - Currently unused, kept for backwards compatibility'
     )
     mockup_group.add_argument(
-        '--no-ipad',
-        action='store_true',
-        help='Skip iPad screenshot generation'
-    )
-    mockup_group.add_argument(
-        '--no-gplay',
-        action='store_true',
-        help='Skip Google Play screenshot generation'
-    )
-    mockup_group.add_argument(
-        '--apple-only',
-        action='store_true',
-        help='Generate only Apple App Store screenshots (same as --no-gplay)'
-    )
-    mockup_group.add_argument(
-        '--gplay-only',
-        action='store_true',
-        help='Generate only Google Play Store screenshots (same as --no-ipad)'
-    )
-
-    mockup_group.add_argument(
-        '--with-logo',
-        action='store_true',
-        dest='add_logo',
-        default=None,
-        help='Add transparent-logo.png to bottom-right of mockups'
-    )
-
-    mockup_group.add_argument(
-        '--no-logo',
+        '--no-cache',
         action='store_false',
-        dest='add_logo',
-        help='Skip adding logo to mockups'
+        dest='use_cache',
+        help='Re-render every mockup instead of reusing unchanged ones'
     )
 
-    return parser
+
+# Subcommand name -> builder; only the selected one is built per run
+SUBCOMMANDS = {
+    'capture': _add_capture_parser,
+    'mockups': _add_mockups_parser,
+    'pipeline': _add_pipeline_parser,
+}
 
 
 def cmd_capture(args: argparse.Namespace) -> int:
     """Execute capture command"""
+    from commands.capture import ScreenshotCapture
+
     capture = ScreenshotCapture(
         device=args.device,
         platform=args.platform,
@@ -375,13 +437,7 @@ def cmd_capture(args: argparse.Namespace) -> int:
 
 def cmd_mockups(args: argparse.Namespace) -> int:
     """Execute mockups command"""
-    # Set environment variables for automated choices
-    if args.device_choice is not None:
-        os.environ['DEVICE_CHOICE'] = str(args.device_choice)
-    if args.gradient_choice is not None:
-        os.environ['GRADIENT_CHOICE'] = str(args.gradient_choice)
-    if args.add_logo is not None:
-        os.environ['ADD_LOGO'] = 'true' if args.add_logo else 'false'
+    from commands.generate_mockups import MockupGenerator
 
     # Get project configuration
     project_config = get_project_config(args.project)
@@ -402,16 +458,19 @@ def cmd_mockups(args: argparse.Namespace) -> int:
         output_dir=args.output_dir,
         templates_dir=args.templates_dir,
         generate_ipad=generate_ipad,
-        generate_gplay=generate_gplay
+        generate_gplay=generate_gplay,
+        isolate=args.isolate,
+        use_cache=args.use_cache,
+        device_choice=args.device_choice,
+        gradient_choice=args.gradient_choice,
+        add_logo=args.add_logo
     )
     return generator.generate()
 
 
 def cmd_pipeline(args: argparse.Namespace) -> int:
     """Execute pipeline command"""
-    # Set environment variable for logo choice
-    if args.add_logo is not None:
-        os.environ['ADD_LOGO'] = 'true' if args.add_logo else 'false'
+    from commands.pipeline import ScreenshotPipeline
 
     # Get project configuration
     project_config = get_project_config(args.project)
@@ -434,25 +493,28 @@ def cmd_pipeline(args: argparse.Namespace) -> int:
         device_choice=args.device_choice,
         gradient_choice=args.gradient_choice,
         generate_ipad=generate_ipad,
-        generate_gplay=generate_gplay
+        generate_gplay=generate_gplay,
+        add_logo=args.add_logo,
+        use_cache=args.use_cache
     )
     return pipeline.run()
 
 
 def main() -> int:
     """Main entry point"""
-    # Create parser
-    parser = create_parser()
+    # Create parser (only the branch for the requested subcommand)
+    argv = sys.argv[1:]
+    wants_help = '-h' in argv or '--help' in argv
+    parser = create_parser(_detect_command(argv), with_epilogs=wants_help)
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Set up logging
+    # Set up logging (timestamps/logger names only in verbose mode, so
+    # normal runs don't format asctime for every record)
     log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    log_format = VERBOSE_LOG_FORMAT if args.verbose else '%(message)s'
+    logging.basicConfig(level=log_level, format=log_format)
 
     # Print banner (only for pipeline command)
     if args.command == 'pipeline':
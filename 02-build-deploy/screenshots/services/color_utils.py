@@ -12,9 +12,29 @@ Usage:
 """
 
 import colorsys
+import string
+from functools import lru_cache
 from typing import Tuple
 
 
+# The pure str/float -> str/tuple helpers below are memoized: the mockup
+# pipeline converts the same handful of palette colors over and over.
+_COLOR_CACHE_SIZE = 256
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def _clamp01(x: float) -> float:
+    """Clamp x to [0.0, 1.0] without the generic min()/max() builtins"""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+def _normalize_hex(hex_color: str) -> str:
+    """Lowercase '#rrggbb' form of hex_color (what the HSL round trip returns)"""
+    return rgb_to_hex(*hex_to_rgb(hex_color))
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     Convert hex color to RGB tuple (0-255 range)
@@ -25,12 +45,23 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     Returns:
         Tuple of (R, G, B) values in 0-255 range
 
+    Raises:
+        ValueError: If hex_color is not exactly six hex digits after an
+            optional '#'
+
     Example:
         >>> hex_to_rgb("#FF5733")
         (255, 87, 51)
     """
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # One 24-bit parse of the six digits after an optional '#', then
+    # unpack the channels with shifts/masks
+    digits = hex_color[1:] if hex_color[:1] == '#' else hex_color
+    # Guard clause: int(..., 16) alone would accept short forms, '_' and
+    # surrounding whitespace
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    value = int(digits, 16)
+    return (value >> 16, (value >> 8) & 0xFF, value & 0xFF)
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -49,9 +80,10 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
         >>> rgb_to_hex(255, 87, 51)
         '#ff5733'
     """
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#%06x" % ((r << 16) | (g << 8) | b)
 
 
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def hex_to_hsl(hex_color: str) -> Tuple[float, float, float]:
     """
     Convert hex color to HSL tuple
@@ -95,12 +127,15 @@ def hsl_to_hex(h: float, s: float, l: float) -> str:
     """
     # colorsys uses HLS (H, L, S order)
     r_norm, g_norm, b_norm = colorsys.hls_to_rgb(h, l, s)
+    # Keep round() (banker's rounding) so outputs match the original
+    # rgb_to_hex path exactly; only the packing is inlined
     r = int(round(r_norm * 255))
     g = int(round(g_norm * 255))
     b = int(round(b_norm * 255))
-    return rgb_to_hex(r, g, b)
+    return "#%06x" % ((r << 16) | (g << 8) | b)
 
 
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def lighten_color(hex_color: str, amount: float = 0.20) -> str:
     """
     Increase the lightness of a color by a specified amount
@@ -125,12 +160,20 @@ def lighten_color(hex_color: str, amount: float = 0.20) -> str:
         - If the resulting lightness would exceed 1.0, it's clamped to 1.0
         - Very light colors may not change much as they're already near max
     """
+    # Guard clause: Nothing to change
+    if amount == 0.0:
+        return _normalize_hex(hex_color)
+
     h, s, l = hex_to_hsl(hex_color)
     # Increase lightness, clamping to maximum of 1.0
-    new_l = min(1.0, l + amount)
+    new_l = _clamp01(l + amount)
+    # Guard clause: Already at max lightness
+    if new_l == l:
+        return _normalize_hex(hex_color)
     return hsl_to_hex(h, s, new_l)
 
 
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def darken_color(hex_color: str, amount: float = 0.20) -> str:
     """
     Decrease the lightness of a color by a specified amount
@@ -147,12 +190,20 @@ def darken_color(hex_color: str, amount: float = 0.20) -> str:
         >>> darken_color("#FF5733", 0.20)
         '#cc2200'  # approximately 20% darker
     """
+    # Guard clause: Nothing to change
+    if amount == 0.0:
+        return _normalize_hex(hex_color)
+
     h, s, l = hex_to_hsl(hex_color)
     # Decrease lightness, clamping to minimum of 0.0
-    new_l = max(0.0, l - amount)
+    new_l = _clamp01(l - amount)
+    # Guard clause: Already at min lightness
+    if new_l == l:
+        return _normalize_hex(hex_color)
     return hsl_to_hex(h, s, new_l)
 
 
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def get_gradient_colors(
     base_color: str,
     lighten_amount: float = 0.15
@@ -179,6 +230,7 @@ def get_gradient_colors(
     return (base_color, lighter)
 
 
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
 def adjust_saturation(hex_color: str, amount: float) -> str:
     """
     Adjust the saturation of a color
@@ -192,6 +244,13 @@ def adjust_saturation(hex_color: str, amount: float) -> str:
     Returns:
         Hex color string with adjusted saturation
     """
+    # Guard clause: Nothing to change
+    if amount == 0.0:
+        return _normalize_hex(hex_color)
+
     h, s, l = hex_to_hsl(hex_color)
-    new_s = max(0.0, min(1.0, s + amount))
+    new_s = _clamp01(s + amount)
+    # Guard clause: Saturation already clamped
+    if new_s == s:
+        return _normalize_hex(hex_color)
     return hsl_to_hex(h, new_s, l)
\ No newline at end of file
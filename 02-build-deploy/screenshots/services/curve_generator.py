@@ -34,6 +34,16 @@ from config.screenshot_config import DecorativeCurvesConfig
 class CurveGenerator:
     """Generates decorative curves for mockup backgrounds"""
 
+    # Curve layers are one color plus anti-aliased alpha, so a 256-color palette
+    # is visually lossless and far cheaper to encode than truecolor RGBA.
+    # Only these layers are quantized, never the composited mockup.
+    PALETTE_OUTPUT_ARGS = [
+        '-quantize', 'sRGB',
+        '-colors', '256',
+        '-define', 'png:compression-filter=2',
+        '-define', 'png:compression-strategy=1',
+    ]
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.config = DecorativeCurvesConfig
@@ -48,7 +58,9 @@ class CurveGenerator:
         Returns:
             Seeded random.Random instance
         """
-        hash_int = int(hashlib.md5(seed.encode()).hexdigest(), 16)
+        # Same integer as int(md5.hexdigest(), 16), without the hex round trip.
+        # MD5 is kept so existing seeds keep producing the same curves.
+        hash_int = int.from_bytes(hashlib.md5(seed.encode()).digest(), 'big')
         rng = random.Random(hash_int)
         return rng
 
@@ -212,8 +224,8 @@ class CurveGenerator:
         if len(points) < 3:
             return ""
 
-        # Start path at first point
-        path = f"M {points[0][0]},{points[0][1]} "
+        # Start path at first point (segments collected and joined once)
+        parts = [f"M {points[0][0]},{points[0][1]} "]
 
         # Use quadratic Bezier curves through all points
         # Q command: Q control_x,control_y end_x,end_y
@@ -230,7 +242,7 @@ class CurveGenerator:
                 end_x = points[i + 1][0]
                 end_y = points[i + 1][1]
 
-            path += f"Q {ctrl[0]},{ctrl[1]} {end_x},{end_y} "
+            parts.append(f"Q {ctrl[0]},{ctrl[1]} {end_x},{end_y} ")
 
         # Close the shape by drawing to canvas edge and back
         last_point = points[-1]
@@ -238,14 +250,14 @@ class CurveGenerator:
 
         if fill_to_edge == 'left':
             # Draw down to bottom-left, across bottom, up to start
-            path += f"L 0,{height} L 0,{first_point[1]} Z"
+            parts.append(f"L 0,{height} L 0,{first_point[1]} Z")
         elif fill_to_edge == 'right':
             # Draw down to bottom-right, across bottom, up to start
-            path += f"L {width},{height} L {width},{first_point[1]} Z"
+            parts.append(f"L {width},{height} L {width},{first_point[1]} Z")
         else:
-            path += f"L {last_point[0]},{height} L {first_point[0]},{height} Z"
+            parts.append(f"L {last_point[0]},{height} L {first_point[0]},{height} Z")
 
-        return path
+        return "".join(parts)
 
     def _blob_to_svg_path(
         self,
@@ -263,19 +275,17 @@ class CurveGenerator:
         if len(points) < 6:
             return ""
 
-        path = f"M {points[0][0]},{points[0][1]} "
-
-        # First curve segment
-        path += f"C {points[1][0]},{points[1][1]} "
-        path += f"{points[2][0]},{points[2][1]} "
-        path += f"{points[3][0]},{points[3][1]} "
-
-        # Second curve segment to close
-        path += f"C {points[4][0]},{points[4][1]} "
-        path += f"{points[5][0]},{points[5][1]} "
-        path += f"{points[0][0]},{points[0][1]} Z"
-
-        return path
+        return (
+            f"M {points[0][0]},{points[0][1]} "
+            # First curve segment
+            f"C {points[1][0]},{points[1][1]} "
+            f"{points[2][0]},{points[2][1]} "
+            f"{points[3][0]},{points[3][1]} "
+            # Second curve segment to close
+            f"C {points[4][0]},{points[4][1]} "
+            f"{points[5][0]},{points[5][1]} "
+            f"{points[0][0]},{points[0][1]} Z"
+        )
 
     def generate_curve_paths(
         self,
@@ -368,22 +378,87 @@ class CurveGenerator:
                 '-draw', f"path '{path}'"
             ])
 
-        # Output file
+        # Output file (palette PNG)
+        cmd.extend(self.PALETTE_OUTPUT_ARGS)
         cmd.append(str(output_path))
 
         try:
             self.logger.debug(f"Running ImageMagick command: {' '.join(cmd[:10])}...")
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,  # never inspected
+                stderr=subprocess.PIPE,
                 check=True
             )
             self.logger.info(f"Created curve overlay: {output_path}")
             return True
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"ImageMagick failed: {e.stderr}")
+            # Output is bytes; only decoded on failure
+            self.logger.error(f"ImageMagick failed: {e.stderr.decode('utf-8', errors='replace')}")
+            return False
+        except FileNotFoundError:
+            self.logger.error("ImageMagick (magick) not found. Please install it.")
+            return False
+
+    def create_curve_overlays_batch(
+        self,
+        jobs: List[Tuple[int, int, str, str, Path]]
+    ) -> bool:
+        """
+        Create several curve overlays with a single ImageMagick invocation
+
+        Each overlay is drawn in its own parenthesized image sequence and
+        written with -write, so N overlays pay for one magick process
+        startup instead of N.
+
+        Args:
+            jobs: (width, height, curve_color, seed, output_path) per overlay,
+                  same meaning as the create_curve_overlay arguments
+
+        Returns:
+            True if every overlay was written, False otherwise
+        """
+        # Guard clause: Nothing to render
+        if not jobs:
+            return True
+
+        # null: gives the outer sequence an image, so the final null: output is valid
+        cmd = ['magick', 'null:']
+
+        for width, height, curve_color, seed, output_path in jobs:
+            paths = self.generate_curve_paths(width, height, seed)
+
+            if not paths:
+                self.logger.warning(f"No curve paths generated for seed: {seed}")
+                return False
+
+            cmd.extend(['(', '-size', f'{width}x{height}', 'xc:none'])
+            for path in paths:
+                cmd.extend([
+                    '-fill', curve_color,
+                    '-draw', f"path '{path}'"
+                ])
+            # Palette PNG, written and dropped before the next overlay
+            cmd.extend(self.PALETTE_OUTPUT_ARGS)
+            cmd.extend(['-write', str(output_path), '+delete', ')'])
+
+        cmd.append('null:')
+
+        try:
+            self.logger.debug(f"Running ImageMagick batch for {len(jobs)} curve overlays")
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,  # never inspected
+                stderr=subprocess.PIPE,
+                check=True
+            )
+            self.logger.info(f"Created {len(jobs)} curve overlays")
+            return True
+
+        except subprocess.CalledProcessError as e:
+            # Output is bytes; only decoded on failure
+            self.logger.error(f"ImageMagick failed: {e.stderr.decode('utf-8', errors='replace')}")
             return False
         except FileNotFoundError:
             self.logger.error("ImageMagick (magick) not found. Please install it.")
@@ -478,7 +553,7 @@ class CurveGenerator:
         if len(points) < 3:
             return ""
 
-        path = f"M {points[0][0]},{points[0][1]} "
+        parts = [f"M {points[0][0]},{points[0][1]} "]
 
         for i in range(1, len(points) - 1):
             ctrl = points[i]
@@ -489,19 +564,19 @@ class CurveGenerator:
                 end_x = points[i + 1][0]
                 end_y = points[i + 1][1]
 
-            path += f"Q {ctrl[0]},{ctrl[1]} {end_x},{end_y} "
+            parts.append(f"Q {ctrl[0]},{ctrl[1]} {end_x},{end_y} ")
 
         last_point = points[-1]
         first_point = points[0]
 
         if fill_to_edge == 'top':
             # Close to top edge
-            path += f"L {width},0 L 0,0 L {first_point[0]},{first_point[1]} Z"
+            parts.append(f"L {width},0 L 0,0 L {first_point[0]},{first_point[1]} Z")
         else:
             # Close to bottom edge
-            path += f"L {width},{height} L 0,{height} L {first_point[0]},{first_point[1]} Z"
+            parts.append(f"L {width},{height} L 0,{height} L {first_point[0]},{first_point[1]} Z")
 
-        return path
+        return "".join(parts)
 
     def generate_horizontal_curve_paths(
         self,
@@ -589,21 +664,23 @@ class CurveGenerator:
                 '-draw', f"path '{path}'"
             ])
 
+        cmd.extend(self.PALETTE_OUTPUT_ARGS)
         cmd.append(str(output_path))
 
         try:
             self.logger.debug(f"Running ImageMagick command: {' '.join(cmd[:10])}...")
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,  # never inspected
+                stderr=subprocess.PIPE,
                 check=True
             )
             self.logger.info(f"Created horizontal curve overlay: {output_path}")
             return True
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"ImageMagick failed: {e.stderr}")
+            # Output is bytes; only decoded on failure
+            self.logger.error(f"ImageMagick failed: {e.stderr.decode('utf-8', errors='replace')}")
             return False
         except FileNotFoundError:
             self.logger.error("ImageMagick (magick) not found. Please install it.")
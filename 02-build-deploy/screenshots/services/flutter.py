@@ -41,7 +41,8 @@ class FlutterService:
         try:
             subprocess.run(
                 [self.FLUTTER_CMD, "--version"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True
             )
         except (subprocess.CalledProcessError, FileNotFoundError):
@@ -64,7 +65,7 @@ class FlutterService:
             check: Whether to raise exception on non-zero exit
 
         Returns:
-            CompletedProcess with result
+            CompletedProcess with result (stdout/stderr as bytes)
 
         Raises:
             FlutterError: If command fails and check=True
@@ -79,16 +80,16 @@ class FlutterService:
                 cmd,
                 cwd=working_dir,
                 capture_output=True,
-                text=True,
                 check=check
             )
             return result
         except subprocess.CalledProcessError as e:
+            # Output is bytes; only decoded on failure
             raise FlutterError(
                 f"Flutter command failed: {' '.join(cmd)}\n"
                 f"Exit code: {e.returncode}\n"
-                f"Stdout: {e.stdout}\n"
-                f"Stderr: {e.stderr}"
+                f"Stdout: {e.stdout.decode('utf-8', errors='replace')}\n"
+                f"Stderr: {e.stderr.decode('utf-8', errors='replace')}"
             )
 
     def run_integration_test(
@@ -5,9 +5,11 @@ ImageMagick Service
 Wraps ImageMagick operations for creating mockup effects.
 """
 
+import hashlib
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # Import configuration
@@ -31,11 +33,27 @@ class ImageMagickService:
     MAGICK_CMD = "magick"
     CONVERT_CMD = "convert"  # Fallback for older ImageMagick
 
+    # Disk cache for rendered decorative curve layers (shared across runs)
+    CURVES_CACHE_DIR = Path(tempfile.gettempdir()) / "mockup_curves_cache"
+
+    # Disk cache for logos pre-resized to their watermark size (shared across runs)
+    LOGO_CACHE_DIR = Path(tempfile.gettempdir()) / "mockup_logo_cache"
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.cmd = self._detect_imagemagick_cmd()
         self.curve_generator = CurveGenerator()
 
+        # Gradients pre-rendered once per run: (width, height, start, end) -> .mpc path
+        self._gradient_cache: Dict[Tuple[int, int, str, str], Path] = {}
+        self._gradient_cache_dir: Optional[Path] = None
+
+        # Rendered curve layers: (width, height, color, seed) -> PNG in CURVES_CACHE_DIR
+        # (created here once, not on every cache miss)
+        self._curve_layer_cache: Dict[Tuple[int, int, str, str], Path] = {}
+        self.CURVES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.LOGO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
     def _detect_imagemagick_cmd(self) -> str:
         """
         Detect which ImageMagick command is available
@@ -71,6 +89,27 @@ class ImageMagickService:
                 "ImageMagick not found. Please install ImageMagick 7+ or ImageMagick 6."
             )
 
+    @staticmethod
+    def _write_settings() -> list:
+        """
+        Global settings prepended to every ImageMagick command
+
+        Mockups are truecolor PNGs: dithering buys nothing, ancillary chunks
+        (timestamps, gamma, text) are dropped, and zlib runs at
+        MockupConfig.MAGICK_PNG_COMPRESSION_LEVEL instead of IM's slower default.
+        Memory/area limits cap each command's pixel cache under parallel workers.
+
+        Returns:
+            List of ImageMagick settings
+        """
+        return [
+            "-limit", "area", MockupConfig.MAGICK_AREA_LIMIT,
+            "-limit", "memory", MockupConfig.MAGICK_MEMORY_LIMIT,
+            "+dither",
+            "-define", f"png:compression-level={MockupConfig.MAGICK_PNG_COMPRESSION_LEVEL}",
+            "-define", "png:exclude-chunk=all",
+        ]
+
     def _run_magick(
         self,
         args: list,
@@ -84,26 +123,26 @@ class ImageMagickService:
             check: Whether to raise exception on failure
 
         Returns:
-            CompletedProcess
+            CompletedProcess (stdout/stderr as raw bytes)
 
         Raises:
             ImageMagickError: If command fails and check=True
         """
-        cmd = [self.cmd] + args
+        cmd = [self.cmd] + self._write_settings() + args
         self.logger.debug(f"Running: {' '.join(cmd)}")
 
+        # Output is kept as bytes: almost no caller reads it, so only decode on failure
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 check=check
             )
             return result
         except subprocess.CalledProcessError as e:
             raise ImageMagickError(
                 f"ImageMagick command failed: {' '.join(cmd)}\n"
-                f"Error: {e.stderr}"
+                f"Error: {e.stderr.decode('utf-8', 'replace')}"
             )
 
     def apply_3d_perspective(
@@ -378,7 +417,7 @@ class ImageMagickService:
         args = [str(image_path), "-format", "%wx%h", "info:"]
 
         result = self._run_magick(args)
-        width, height = result.stdout.strip().split('x')
+        width, height = result.stdout.decode().strip().split('x')
 
         return int(width), int(height)
 
@@ -410,6 +449,31 @@ class ImageMagickService:
         self._run_magick(args)
         self.logger.info(f"Resized image to {width}x{height}: {output_path}")
 
+    def decode_to_pixel_cache(
+        self,
+        input_path: Path,
+        output_path: Path
+    ) -> Path:
+        """
+        Decode an image once into ImageMagick's pixel cache format (.mpc)
+
+        Reading an .mpc back is a memory map, not a PNG decode, so a source
+        used by several targets is decoded a single time. The crop and resize
+        of each target still start from the full-resolution pixels.
+
+        Args:
+            input_path: Source image
+            output_path: Output path (must end in .mpc; a .cache file is written next to it)
+
+        Returns:
+            Path to the .mpc file
+        """
+        if not input_path.exists():
+            raise ImageMagickError(f"Input file not found: {input_path}")
+
+        self._run_magick([str(input_path), str(output_path)])
+        return output_path
+
     def resize_to_apple_iphone(
         self,
         input_path: Path,
@@ -1013,38 +1077,20 @@ class ImageMagickService:
         curve_color = lighten_color(gradient_start, DecorativeCurvesConfig.LIGHTNESS_INCREASE)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_gradient = Path(temp_dir) / "gradient.png"
-            temp_curves = Path(temp_dir) / "curves.png"
             temp_bg_with_curves = Path(temp_dir) / "bg_with_curves.png"
             temp_bg_with_top_image = Path(temp_dir) / "bg_with_top_image.png"
 
-            # Step 1: Create gradient background
-            gradient_args = [
-                "-size", f"{canvas_width}x{canvas_height}",
-                f"gradient:{gradient_start}-{gradient_end}",
-                str(temp_gradient)
-            ]
-            self._run_magick(gradient_args)
-
-            # Step 2: Generate decorative curves
-            self.curve_generator.create_curve_overlay(
-                width=canvas_width,
-                height=canvas_height,
+            # Steps 1-3: Gradient + decorative curves background
+            self._create_curves_background(
+                canvas_width=canvas_width,
+                canvas_height=canvas_height,
+                gradient_start=gradient_start,
+                gradient_end=gradient_end,
                 curve_color=curve_color,
                 seed=seed,
-                output_path=temp_curves
+                output_path=temp_bg_with_curves
             )
 
-            # Step 3: Composite curves on gradient
-            curves_composite_args = [
-                str(temp_gradient),
-                str(temp_curves),
-                "-gravity", "center",
-                "-composite",
-                str(temp_bg_with_curves)
-            ]
-            self._run_magick(curves_composite_args)
-
             # Step 4: Add top image if provided
             final_bg = temp_bg_with_curves
             if top_image_path and top_image_path.exists():
@@ -1198,51 +1244,377 @@ class ImageMagickService:
         right_padding = int(canvas_width * config.right_padding_percent)
         bottom_padding = int(bottom_space_height * config.bottom_padding_percent)
 
+        # Step 1: Resize maintaining aspect ratio (done once per logo and size)
+        resized_logo = self._get_resized_logo(logo_path, max_width, max_height)
+
+        # Step 2: Composite logo onto background at bottom-right
+        # Using southeast gravity with padding offset
+        composite_args = [
+            str(background_path),
+            str(resized_logo),
+            "-gravity", "southeast",
+            "-geometry", f"+{right_padding}+{bottom_padding}",
+            "-compose", "Over",
+            "-composite",
+            str(output_path)
+        ]
+        self._run_magick(composite_args)
+
+        self.logger.info(f"Added bottom logo [{device_type}]: {logo_path.name}")
+
+    def _get_resized_logo(
+        self,
+        logo_path: Path,
+        max_width: int,
+        max_height: int
+    ) -> Path:
+        """
+        Return the logo scaled to fit max_width x max_height, resizing it once.
+
+        Client logos can be much larger than the watermark, and every mockup
+        composites the logo more than once. The scaled copy is cached on disk in
+        LOGO_CACHE_DIR, keyed by the source path, its mtime and the box size.
+
+        Args:
+            logo_path: Path to logo image (PNG with transparency)
+            max_width: Maximum logo width in pixels
+            max_height: Maximum logo height in pixels
+
+        Returns:
+            Path to the resized logo PNG
+        """
+        logo_stat = logo_path.stat()
+        digest = hashlib.md5(
+            f"{logo_path.resolve()}:{logo_stat.st_mtime_ns}:{max_width}x{max_height}".encode()
+        ).hexdigest()
+        resized_path = self.LOGO_CACHE_DIR / f"logo_{max_width}x{max_height}_{digest}.png"
+
+        # Guard clause: Already resized (this run or a previous one)
+        if resized_path.exists():
+            return resized_path
+
+        # Get original image dimensions
+        orig_width, orig_height = self.get_image_size(logo_path)
+
+        # Calculate scale factors for BOTH constraints
+        scale_by_width = max_width / orig_width
+        scale_by_height = max_height / orig_height
+
+        # Use the SMALLER scale to ensure image fits BOTH constraints
+        scale = min(scale_by_width, scale_by_height)
+
+        new_width = int(orig_width * scale)
+        new_height = int(orig_height * scale)
+
+        self.logger.debug(
+            f"Bottom logo: {orig_width}x{orig_height} -> "
+            f"{new_width}x{new_height} (max: {max_width}x{max_height})"
+        )
+
+        # Render to a private file and rename: parallel workers never see partial PNGs
+        temp_path = resized_path.with_name(f"{resized_path.stem}.{os.getpid()}.png")
+        resize_args = [
+            str(logo_path),
+            "-resize", f"{new_width}x{new_height}",
+            "-background", "none",
+            str(temp_path)
+        ]
+        self._run_magick(resize_args)
+        os.replace(temp_path, resized_path)
+
+        return resized_path
+
+    def prerender_gradients(
+        self,
+        gradient_start: str,
+        gradient_end: str,
+        sizes: List[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Path]:
+        """
+        Render the vertical gradient once per canvas size and cache it for the run.
+
+        Gradients do not depend on the screenshot, so each size is rendered a
+        single time and reused by _create_curves_background. They are stored as
+        .mpc (ImageMagick's memory-mapped pixel cache), which is read back
+        without decoding.
+
+        Args:
+            gradient_start: Gradient start color (hex)
+            gradient_end: Gradient end color (hex)
+            sizes: Canvas sizes (width, height) to render
+
+        Returns:
+            Dict mapping (width, height) to the cached gradient path
+        """
         import tempfile
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_resized = Path(temp_dir) / "logo_resized.png"
 
-            # Get original image dimensions
-            orig_width, orig_height = self.get_image_size(logo_path)
+        if self._gradient_cache_dir is None:
+            self._gradient_cache_dir = Path(tempfile.mkdtemp(prefix="mockup_gradients_"))
 
-            # Calculate scale factors for BOTH constraints
-            scale_by_width = max_width / orig_width
-            scale_by_height = max_height / orig_height
+        rendered = {}
+        for width, height in sizes:
+            key = (width, height, gradient_start, gradient_end)
+            gradient_path = self._gradient_cache.get(key)
+            if gradient_path is None:
+                gradient_path = self._gradient_cache_dir / f"gradient_{len(self._gradient_cache)}_{width}x{height}.mpc"
+                args = [
+                    "-size", f"{width}x{height}",
+                    f"gradient:{gradient_start}-{gradient_end}",
+                    str(gradient_path)
+                ]
+                self._run_magick(args)
+                self._gradient_cache[key] = gradient_path
+            rendered[(width, height)] = gradient_path
 
-            # Use the SMALLER scale to ensure image fits BOTH constraints
-            scale = min(scale_by_width, scale_by_height)
+        return rendered
 
-            new_width = int(orig_width * scale)
-            new_height = int(orig_height * scale)
+    def clear_prerendered_gradients(self) -> None:
+        """Remove gradients cached by prerender_gradients"""
+        import shutil
 
-            self.logger.debug(
-                f"Bottom logo [{device_type}]: {orig_width}x{orig_height} -> "
-                f"{new_width}x{new_height} (max: {max_width}x{max_height})"
+        if self._gradient_cache_dir is not None:
+            shutil.rmtree(self._gradient_cache_dir, ignore_errors=True)
+        self._gradient_cache.clear()
+        self._gradient_cache_dir = None
+
+    def _curves_cache_path(
+        self,
+        width: int,
+        height: int,
+        curve_color: str,
+        seed: str
+    ) -> Path:
+        """
+        Disk cache location of the curve layer for (size, color, seed)
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            curve_color: Hex color for the curves
+            seed: Seed string for reproducible curve generation
+
+        Returns:
+            Path in CURVES_CACHE_DIR (may not exist yet)
+        """
+        paths = self.curve_generator.generate_curve_paths(width, height, seed)
+        digest = hashlib.md5(
+            "\n".join([f"{width}x{height}", curve_color] + paths).encode()
+        ).hexdigest()
+        return self.CURVES_CACHE_DIR / f"curves_{width}x{height}_{digest}.png"
+
+    def prerender_curves(
+        self,
+        gradient_start: str,
+        sizes: List[Tuple[int, int]],
+        seed: str
+    ) -> None:
+        """
+        Render one screenshot's curve layers for several canvas sizes at once.
+
+        Layers missing from CURVES_CACHE_DIR are drawn by a single magick
+        invocation (CurveGenerator.create_curve_overlays_batch) instead of one
+        process per size. _get_or_render_curves then finds them cached. On
+        failure nothing is raised: each size falls back to its own render.
+
+        Args:
+            gradient_start: Gradient start color (curves use a lighter shade)
+            sizes: Canvas sizes (width, height) that will need curves
+            seed: Seed string for reproducible curve generation
+        """
+        curve_color = lighten_color(gradient_start, DecorativeCurvesConfig.LIGHTNESS_INCREASE)
+
+        jobs = []
+        pending = []
+        for width, height in sizes:
+            key = (width, height, curve_color, seed)
+            cached = self._curve_layer_cache.get(key)
+            if cached is not None and cached.exists():
+                continue
+
+            curves_path = self._curves_cache_path(width, height, curve_color, seed)
+            if curves_path.exists():
+                self._curve_layer_cache[key] = curves_path
+                continue
+
+            # Render to a private file and rename: parallel workers never see partial PNGs
+            temp_path = curves_path.with_name(f"{curves_path.stem}.{os.getpid()}.png")
+            jobs.append((width, height, curve_color, seed, temp_path))
+            pending.append((key, temp_path, curves_path))
+
+        # Guard clause: Every layer already cached
+        if not jobs:
+            return
+
+        if not self.curve_generator.create_curve_overlays_batch(jobs):
+            self.logger.warning(f"Batch curve render failed for seed {seed}; rendering per size")
+            # Drop any partial temp files the failed batch left behind
+            for _, temp_path, _ in pending:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+            return
+
+        for key, temp_path, curves_path in pending:
+            os.replace(temp_path, curves_path)
+            self._curve_layer_cache[key] = curves_path
+
+    def _get_or_render_curves(
+        self,
+        width: int,
+        height: int,
+        curve_color: str,
+        seed: str
+    ) -> Path:
+        """
+        Return the decorative curve layer for (size, color, seed), rendering it once.
+
+        Curves depend only on these inputs, so the transparent PNG is cached
+        on disk in CURVES_CACHE_DIR. The file name hashes the generated SVG
+        paths too, so changes to the curve settings never reuse a stale layer.
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            curve_color: Hex color for the curves
+            seed: Seed string for reproducible curve generation
+
+        Returns:
+            Path to the curve layer PNG
+
+        Raises:
+            ImageMagickError: If the curve layer cannot be rendered
+        """
+        key = (width, height, curve_color, seed)
+        cached = self._curve_layer_cache.get(key)
+        if cached is not None and cached.exists():
+            return cached
+
+        curves_path = self._curves_cache_path(width, height, curve_color, seed)
+
+        if not curves_path.exists():
+            # Render to a private file and rename: parallel workers never see partial PNGs
+            temp_path = curves_path.with_name(f"{curves_path.stem}.{os.getpid()}.png")
+            rendered = self.curve_generator.create_curve_overlay(
+                width=width,
+                height=height,
+                curve_color=curve_color,
+                seed=seed,
+                output_path=temp_path
             )
+            if not rendered:
+                raise ImageMagickError(f"Failed to create curve overlay for seed: {seed}")
+            os.replace(temp_path, curves_path)
 
-            # Step 1: Resize maintaining aspect ratio
-            resize_args = [
-                str(logo_path),
-                "-resize", f"{new_width}x{new_height}",
-                "-background", "none",
-                str(temp_resized)
-            ]
-            self._run_magick(resize_args)
+        self._curve_layer_cache[key] = curves_path
+        return curves_path
 
-            # Step 2: Composite logo onto background at bottom-right
-            # Using southeast gravity with padding offset
-            composite_args = [
-                str(background_path),
-                str(temp_resized),
-                "-gravity", "southeast",
-                "-geometry", f"+{right_padding}+{bottom_padding}",
-                "-compose", "Over",
-                "-composite",
-                str(output_path)
+    def _create_curves_background(
+        self,
+        canvas_width: int,
+        canvas_height: int,
+        gradient_start: str,
+        gradient_end: str,
+        curve_color: str,
+        seed: str,
+        output_path: Path
+    ) -> None:
+        """
+        Create gradient background with decorative curves composited on top.
+
+        Uses the gradient cached by prerender_gradients when available;
+        otherwise it is rendered in memory and composited with the curves in
+        the same magick call (no intermediate gradient PNG).
+
+        Args:
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+            gradient_start: Gradient start color (hex)
+            gradient_end: Gradient end color (hex)
+            curve_color: Color of the decorative curves
+            seed: Seed string for reproducible curve generation
+            output_path: Output background path
+        """
+        curves_path = self._get_or_render_curves(canvas_width, canvas_height, curve_color, seed)
+
+        gradient_path = self._gradient_cache.get((canvas_width, canvas_height, gradient_start, gradient_end))
+        if gradient_path is not None:
+            background_args = [str(gradient_path)]
+        else:
+            background_args = [
+                "-size", f"{canvas_width}x{canvas_height}",
+                f"gradient:{gradient_start}-{gradient_end}"
             ]
-            self._run_magick(composite_args)
 
-        self.logger.info(f"Added bottom logo [{device_type}]: {logo_path.name}")
+        args = background_args + [
+            str(curves_path),
+            "-gravity", "center",
+            "-composite",
+            str(output_path)
+        ]
+        self._run_magick(args)
+
+    def _create_rounded_screenshot_with_shadow(
+        self,
+        input_path: Path,
+        crop_geometry: str,
+        screenshot_width: int,
+        screenshot_height: int,
+        corner_radius: int,
+        shadow_geometry: str,
+        output_path: Path
+    ) -> None:
+        """
+        Crop, resize, round corners and add drop shadow in a single magick call.
+
+        The source is decoded once; the rounded screenshot is kept in an
+        mpr: register and reused for the shadow and the final composite,
+        instead of round-tripping through four intermediate PNGs.
+
+        Args:
+            input_path: Source screenshot
+            crop_geometry: Crop geometry (WxH+X+Y)
+            screenshot_width: Width after resize
+            screenshot_height: Height after resize
+            corner_radius: Corner radius in pixels
+            shadow_geometry: Shadow geometry (e.g. 50x50+0+20)
+            output_path: Output path (screenshot over its shadow, 100px padding)
+        """
+        args = [
+            str(input_path),
+            "-crop", crop_geometry,
+            "+repage",
+            "-resize", f"{screenshot_width}x{screenshot_height}",
+            "(",
+            "+clone",
+            "-alpha", "extract",
+            "-draw", f"fill black polygon 0,0 0,{corner_radius} {corner_radius},0 "
+                     f"fill white circle {corner_radius},{corner_radius} {corner_radius},0",
+            "(",
+            "+clone", "-flip",
+            ")", "-compose", "Multiply", "-composite",
+            "(",
+            "+clone", "-flop",
+            ")", "-compose", "Multiply", "-composite",
+            ")",
+            "-alpha", "off",
+            "-compose", "CopyOpacity",
+            "-composite",
+            "-write", "mpr:rounded",
+            "+delete",
+            "-compose", "Over",
+            "-size", f"{screenshot_width + 100}x{screenshot_height + 100}",
+            "xc:none",
+            "(",
+            "mpr:rounded",
+            "-background", "none",
+            "-shadow", shadow_geometry,
+            ")",
+            "-gravity", "center", "-composite",
+            "mpr:rounded", "-gravity", "center", "-composite",
+            str(output_path)
+        ]
+        self._run_magick(args)
 
     def create_iphone_mockup_with_curves(
         self,
@@ -1408,90 +1780,31 @@ class ImageMagickService:
         curve_color = lighten_color(gradient_start, DecorativeCurvesConfig.LIGHTNESS_INCREASE)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_cropped = Path(temp_dir) / "cropped.png"
-            temp_resized = Path(temp_dir) / "resized.png"
-            temp_rounded = Path(temp_dir) / "rounded.png"
-            temp_shadow = Path(temp_dir) / "shadow.png"
-            temp_gradient = Path(temp_dir) / "gradient.png"
-            temp_curves = Path(temp_dir) / "curves.png"
             temp_bg_with_curves = Path(temp_dir) / "bg_with_curves.png"
             temp_with_shadow = Path(temp_dir) / "with_shadow.png"
 
-            # Step 1: Crop to iPad aspect ratio
-            crop_args = [
-                str(input_path),
-                "-crop", f"{new_width}x{new_height}+{crop_x}+{crop_y}",
-                "+repage",
-                str(temp_cropped)
-            ]
-            self._run_magick(crop_args)
-
-            # Step 2: Resize to calculated dimensions
-            resize_args = [
-                str(temp_cropped),
-                "-resize", f"{screenshot_width}x{screenshot_height}",
-                str(temp_resized)
-            ]
-            self._run_magick(resize_args)
-
-            # Step 3: Apply rounded corners
-            rounded_args = [
-                str(temp_resized),
-                "(",
-                "+clone",
-                "-alpha", "extract",
-                "-draw", f"fill black polygon 0,0 0,{corner_radius} {corner_radius},0 "
-                         f"fill white circle {corner_radius},{corner_radius} {corner_radius},0",
-                "(",
-                "+clone", "-flip",
-                ")", "-compose", "Multiply", "-composite",
-                "(",
-                "+clone", "-flop",
-                ")", "-compose", "Multiply", "-composite",
-                ")",
-                "-alpha", "off",
-                "-compose", "CopyOpacity",
-                "-composite",
-                str(temp_rounded)
-            ]
-            self._run_magick(rounded_args)
-
-            # Step 4: Create shadow
-            shadow_args = [
-                str(temp_rounded),
-                "-background", "none",
-                "-shadow", f"{AppleStoreConfig.IPAD_SHADOW_BLUR}x{AppleStoreConfig.IPAD_SHADOW_BLUR}+0+{AppleStoreConfig.IPAD_SHADOW_OFFSET_Y}",
-                str(temp_shadow)
-            ]
-            self._run_magick(shadow_args)
-
-            # Step 5: Create gradient background
-            gradient_args = [
-                "-size", f"{final_width}x{final_height}",
-                f"gradient:{gradient_start}-{gradient_end}",
-                str(temp_gradient)
-            ]
-            self._run_magick(gradient_args)
+            # Steps 1-4: Crop, resize, round corners and add shadow (one magick call)
+            self._create_rounded_screenshot_with_shadow(
+                input_path=input_path,
+                crop_geometry=f"{new_width}x{new_height}+{crop_x}+{crop_y}",
+                screenshot_width=screenshot_width,
+                screenshot_height=screenshot_height,
+                corner_radius=corner_radius,
+                shadow_geometry=f"{AppleStoreConfig.IPAD_SHADOW_BLUR}x{AppleStoreConfig.IPAD_SHADOW_BLUR}+0+{AppleStoreConfig.IPAD_SHADOW_OFFSET_Y}",
+                output_path=temp_with_shadow
+            )
 
-            # Step 6: Generate decorative curves
-            self.curve_generator.create_curve_overlay(
-                width=final_width,
-                height=final_height,
+            # Steps 5-7: Gradient + decorative curves background
+            self._create_curves_background(
+                canvas_width=final_width,
+                canvas_height=final_height,
+                gradient_start=gradient_start,
+                gradient_end=gradient_end,
                 curve_color=curve_color,
                 seed=seed,
-                output_path=temp_curves
+                output_path=temp_bg_with_curves
             )
 
-            # Step 7: Composite curves on gradient
-            curves_composite_args = [
-                str(temp_gradient),
-                str(temp_curves),
-                "-gravity", "center",
-                "-composite",
-                str(temp_bg_with_curves)
-            ]
-            self._run_magick(curves_composite_args)
-
             # Step 7.5: Add top image if provided
             final_bg = temp_bg_with_curves
             if top_image_path and top_image_path.exists():
@@ -1519,16 +1832,6 @@ class ImageMagickService:
                 )
                 final_bg = temp_bg_with_logo
 
-            # Step 8: Composite shadow and rounded screenshot together
-            shadow_composite_args = [
-                "-size", f"{screenshot_width + 100}x{screenshot_height + 100}",
-                "xc:none",
-                str(temp_shadow), "-gravity", "center", "-composite",
-                str(temp_rounded), "-gravity", "center", "-composite",
-                str(temp_with_shadow)
-            ]
-            self._run_magick(shadow_composite_args)
-
             # Step 9: Composite with asymmetric positioning
             temp_composited = Path(temp_dir) / "composited.png"
             self.composite_with_asymmetric_position(
@@ -1625,90 +1928,31 @@ class ImageMagickService:
         curve_color = lighten_color(gradient_start, DecorativeCurvesConfig.LIGHTNESS_INCREASE)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_cropped = Path(temp_dir) / "cropped.png"
-            temp_resized = Path(temp_dir) / "resized.png"
-            temp_rounded = Path(temp_dir) / "rounded.png"
-            temp_shadow = Path(temp_dir) / "shadow.png"
-            temp_gradient = Path(temp_dir) / "gradient.png"
-            temp_curves = Path(temp_dir) / "curves.png"
             temp_bg_with_curves = Path(temp_dir) / "bg_with_curves.png"
             temp_with_shadow = Path(temp_dir) / "with_shadow.png"
 
-            # Step 1: Crop to phone aspect ratio
-            crop_args = [
-                str(input_path),
-                "-crop", f"{new_width}x{new_height}+{crop_x}+{crop_y}",
-                "+repage",
-                str(temp_cropped)
-            ]
-            self._run_magick(crop_args)
-
-            # Step 2: Resize
-            resize_args = [
-                str(temp_cropped),
-                "-resize", f"{screenshot_width}x{screenshot_height}",
-                str(temp_resized)
-            ]
-            self._run_magick(resize_args)
-
-            # Step 3: Apply rounded corners
-            rounded_args = [
-                str(temp_resized),
-                "(",
-                "+clone",
-                "-alpha", "extract",
-                "-draw", f"fill black polygon 0,0 0,{corner_radius} {corner_radius},0 "
-                         f"fill white circle {corner_radius},{corner_radius} {corner_radius},0",
-                "(",
-                "+clone", "-flip",
-                ")", "-compose", "Multiply", "-composite",
-                "(",
-                "+clone", "-flop",
-                ")", "-compose", "Multiply", "-composite",
-                ")",
-                "-alpha", "off",
-                "-compose", "CopyOpacity",
-                "-composite",
-                str(temp_rounded)
-            ]
-            self._run_magick(rounded_args)
-
-            # Step 4: Create shadow
-            shadow_args = [
-                str(temp_rounded),
-                "-background", "none",
-                "-shadow", f"{GooglePlayConfig.SHADOW_BLUR}x{GooglePlayConfig.SHADOW_BLUR}+0+{GooglePlayConfig.SHADOW_OFFSET_Y}",
-                str(temp_shadow)
-            ]
-            self._run_magick(shadow_args)
-
-            # Step 5: Create gradient
-            gradient_args = [
-                "-size", f"{final_width}x{final_height}",
-                f"gradient:{gradient_start}-{gradient_end}",
-                str(temp_gradient)
-            ]
-            self._run_magick(gradient_args)
+            # Steps 1-4: Crop, resize, round corners and add shadow (one magick call)
+            self._create_rounded_screenshot_with_shadow(
+                input_path=input_path,
+                crop_geometry=f"{new_width}x{new_height}+{crop_x}+{crop_y}",
+                screenshot_width=screenshot_width,
+                screenshot_height=screenshot_height,
+                corner_radius=corner_radius,
+                shadow_geometry=f"{GooglePlayConfig.SHADOW_BLUR}x{GooglePlayConfig.SHADOW_BLUR}+0+{GooglePlayConfig.SHADOW_OFFSET_Y}",
+                output_path=temp_with_shadow
+            )
 
-            # Step 6: Generate curves
-            self.curve_generator.create_curve_overlay(
-                width=final_width,
-                height=final_height,
+            # Steps 5-7: Gradient + decorative curves background
+            self._create_curves_background(
+                canvas_width=final_width,
+                canvas_height=final_height,
+                gradient_start=gradient_start,
+                gradient_end=gradient_end,
                 curve_color=curve_color,
                 seed=seed,
-                output_path=temp_curves
+                output_path=temp_bg_with_curves
             )
 
-            # Step 7: Composite curves on gradient
-            curves_composite_args = [
-                str(temp_gradient),
-                str(temp_curves),
-                "-gravity", "center",
-                "-composite",
-                str(temp_bg_with_curves)
-            ]
-            self._run_magick(curves_composite_args)
-
             # Step 7.5: Add top image if provided
             final_bg = temp_bg_with_curves
             if top_image_path and top_image_path.exists():
@@ -1736,16 +1980,6 @@ class ImageMagickService:
                 )
                 final_bg = temp_bg_with_logo
 
-            # Step 8: Composite shadow and screenshot
-            shadow_composite_args = [
-                "-size", f"{screenshot_width + 100}x{screenshot_height + 100}",
-                "xc:none",
-                str(temp_shadow), "-gravity", "center", "-composite",
-                str(temp_rounded), "-gravity", "center", "-composite",
-                str(temp_with_shadow)
-            ]
-            self._run_magick(shadow_composite_args)
-
             # Step 9: Composite with asymmetric positioning
             temp_composited = Path(temp_dir) / "composited.png"
             self.composite_with_asymmetric_position(
@@ -1841,90 +2075,31 @@ class ImageMagickService:
         curve_color = lighten_color(gradient_start, DecorativeCurvesConfig.LIGHTNESS_INCREASE)
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_cropped = Path(temp_dir) / "cropped.png"
-            temp_resized = Path(temp_dir) / "resized.png"
-            temp_rounded = Path(temp_dir) / "rounded.png"
-            temp_shadow = Path(temp_dir) / "shadow.png"
-            temp_gradient = Path(temp_dir) / "gradient.png"
-            temp_curves = Path(temp_dir) / "curves.png"
             temp_bg_with_curves = Path(temp_dir) / "bg_with_curves.png"
             temp_with_shadow = Path(temp_dir) / "with_shadow.png"
 
-            # Step 1: Crop to tablet aspect ratio
-            crop_args = [
-                str(input_path),
-                "-crop", f"{new_width}x{new_height}+{crop_x}+{crop_y}",
-                "+repage",
-                str(temp_cropped)
-            ]
-            self._run_magick(crop_args)
-
-            # Step 2: Resize
-            resize_args = [
-                str(temp_cropped),
-                "-resize", f"{screenshot_width}x{screenshot_height}",
-                str(temp_resized)
-            ]
-            self._run_magick(resize_args)
-
-            # Step 3: Apply rounded corners
-            rounded_args = [
-                str(temp_resized),
-                "(",
-                "+clone",
-                "-alpha", "extract",
-                "-draw", f"fill black polygon 0,0 0,{corner_radius} {corner_radius},0 "
-                         f"fill white circle {corner_radius},{corner_radius} {corner_radius},0",
-                "(",
-                "+clone", "-flip",
-                ")", "-compose", "Multiply", "-composite",
-                "(",
-                "+clone", "-flop",
-                ")", "-compose", "Multiply", "-composite",
-                ")",
-                "-alpha", "off",
-                "-compose", "CopyOpacity",
-                "-composite",
-                str(temp_rounded)
-            ]
-            self._run_magick(rounded_args)
-
-            # Step 4: Create shadow
-            shadow_args = [
-                str(temp_rounded),
-                "-background", "none",
-                "-shadow", f"{GooglePlayConfig.SHADOW_BLUR}x{GooglePlayConfig.SHADOW_BLUR}+0+{GooglePlayConfig.SHADOW_OFFSET_Y}",
-                str(temp_shadow)
-            ]
-            self._run_magick(shadow_args)
-
-            # Step 5: Create gradient
-            gradient_args = [
-                "-size", f"{final_width}x{final_height}",
-                f"gradient:{gradient_start}-{gradient_end}",
-                str(temp_gradient)
-            ]
-            self._run_magick(gradient_args)
+            # Steps 1-4: Crop, resize, round corners and add shadow (one magick call)
+            self._create_rounded_screenshot_with_shadow(
+                input_path=input_path,
+                crop_geometry=f"{new_width}x{new_height}+{crop_x}+{crop_y}",
+                screenshot_width=screenshot_width,
+                screenshot_height=screenshot_height,
+                corner_radius=corner_radius,
+                shadow_geometry=f"{GooglePlayConfig.SHADOW_BLUR}x{GooglePlayConfig.SHADOW_BLUR}+0+{GooglePlayConfig.SHADOW_OFFSET_Y}",
+                output_path=temp_with_shadow
+            )
 
-            # Step 6: Generate curves
-            self.curve_generator.create_curve_overlay(
-                width=final_width,
-                height=final_height,
+            # Steps 5-7: Gradient + decorative curves background
+            self._create_curves_background(
+                canvas_width=final_width,
+                canvas_height=final_height,
+                gradient_start=gradient_start,
+                gradient_end=gradient_end,
                 curve_color=curve_color,
                 seed=seed,
-                output_path=temp_curves
+                output_path=temp_bg_with_curves
             )
 
-            # Step 7: Composite curves on gradient
-            curves_composite_args = [
-                str(temp_gradient),
-                str(temp_curves),
-                "-gravity", "center",
-                "-composite",
-                str(temp_bg_with_curves)
-            ]
-            self._run_magick(curves_composite_args)
-
             # Step 7.5: Add top image if provided
             final_bg = temp_bg_with_curves
             if top_image_path and top_image_path.exists():
@@ -1952,16 +2127,6 @@ class ImageMagickService:
                 )
                 final_bg = temp_bg_with_logo
 
-            # Step 8: Composite shadow and screenshot
-            shadow_composite_args = [
-                "-size", f"{screenshot_width + 100}x{screenshot_height + 100}",
-                "xc:none",
-                str(temp_shadow), "-gravity", "center", "-composite",
-                str(temp_rounded), "-gravity", "center", "-composite",
-                str(temp_with_shadow)
-            ]
-            self._run_magick(shadow_composite_args)
-
             # Step 9: Composite with asymmetric positioning
             temp_composited = Path(temp_dir) / "composited.png"
             self.composite_with_asymmetric_position(
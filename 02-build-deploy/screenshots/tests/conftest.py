@@ -0,0 +1,13 @@
+"""
+Pytest configuration for the screenshot automation tests.
+
+Puts the screenshots directory on sys.path so tests import modules the
+same way main.py does (``from config...``, ``import apply_mockup``).
+"""
+
+import os
+import sys
+
+_SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
@@ -0,0 +1,129 @@
+"""
+Tests for apply_mockup.py: corner rounding and resize_to_fit.
+
+Run with:
+    python3 -m pytest tests/
+"""
+
+import numpy as np
+import pytest
+
+import apply_mockup
+from apply_mockup import round_alpha_corners, resize_to_fit
+
+
+# (height, width, radius): large images take the per-corner patch path,
+# small ones (patches overlap) fall back to the full mask
+CORNER_CASES = [
+    (120, 80, 2),
+    (120, 80, 4),
+    (200, 150, 12),
+    (2796, 1290, 55),
+    (20, 18, 5),
+    (9, 9, 3),
+]
+
+
+def _full_mask_reference(alpha, radius):
+    """Alpha composited with the complete HxW mask (the pre-patch path)"""
+    h, w = alpha.shape
+    mask = apply_mockup._build_full_mask(h, w, radius)
+    return apply_mockup._multiply_alpha(alpha.copy(), mask)
+
+
+def _random_alpha(h, w, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(h, w), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("h, w, radius", CORNER_CASES)
+def test_round_alpha_corners_matches_full_mask_contiguous(h, w, radius):
+    alpha = _random_alpha(h, w)
+    expected = _full_mask_reference(alpha, radius)
+
+    result = round_alpha_corners(alpha, radius)
+
+    assert result is alpha
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("h, w, radius", CORNER_CASES)
+def test_round_alpha_corners_matches_full_mask_bgra_view(h, w, radius):
+    alpha = _random_alpha(h, w, seed=1)
+    expected = _full_mask_reference(alpha, radius)
+
+    image = np.zeros((h, w, 4), dtype=np.uint8)
+    image[:, :, :3] = 7
+    image[:, :, 3] = alpha
+    view = image[:, :, 3]
+    assert view.strides[1] == 4
+
+    round_alpha_corners(view, radius)
+
+    np.testing.assert_array_equal(image[:, :, 3], expected)
+    # Color channels are never touched
+    assert (image[:, :, :3] == 7).all()
+
+
+def test_round_alpha_corners_clears_outer_corner_pixels():
+    alpha = np.full((100, 60), 255, dtype=np.uint8)
+
+    round_alpha_corners(alpha, 20)
+
+    for y, x in ((0, 0), (0, 59), (99, 0), (99, 59)):
+        assert alpha[y, x] == 0
+    assert alpha[50, 30] == 255
+
+
+@pytest.mark.parametrize("radius", [0, 1, 60, 500])
+def test_round_alpha_corners_leaves_alpha_for_out_of_range_radius(radius):
+    alpha = _random_alpha(60, 90, seed=2)
+    original = alpha.copy()
+
+    round_alpha_corners(alpha, radius)
+
+    np.testing.assert_array_equal(alpha, original)
+
+
+def _baseline_fit(w, h, target_width, target_height):
+    """Dimensions from the original float/if-else resize_to_fit"""
+    aspect = w / h
+    if aspect > target_width / target_height:
+        return target_width, int(target_width / aspect)
+    return int(target_height * aspect), target_height
+
+
+@pytest.mark.parametrize("w, h, target_width, target_height", [
+    (1290, 2796, 1180, 2556),
+    (1290, 2796, 1242, 2688),
+    (1008, 2244, 1080, 1920),
+    (2048, 2732, 1640, 2360),
+    (1080, 1920, 1080, 1920),
+    (300, 100, 200, 200),
+    (100, 300, 200, 200),
+    (640, 480, 1024, 500),
+])
+def test_resize_to_fit_dimensions(w, h, target_width, target_height):
+    screenshot = np.full((h, w, 4), 255, dtype=np.uint8)
+
+    canvas = resize_to_fit(screenshot, target_width, target_height)
+
+    assert canvas.shape == (target_height, target_width, 4)
+
+    # The opaque region is the resized screenshot, centered on the canvas
+    rows = np.flatnonzero(canvas[:, :, 3].any(axis=1))
+    cols = np.flatnonzero(canvas[:, :, 3].any(axis=0))
+    new_width = cols[-1] - cols[0] + 1
+    new_height = rows[-1] - rows[0] + 1
+    assert (new_width, new_height) == _baseline_fit(w, h, target_width, target_height)
+    assert cols[0] == (target_width - new_width) // 2
+    assert rows[0] == (target_height - new_height) // 2
+
+
+def test_resize_to_fit_padding_is_transparent():
+    screenshot = np.full((400, 100, 4), 255, dtype=np.uint8)
+
+    canvas = resize_to_fit(screenshot, 300, 400)
+
+    assert (canvas[:, :100] == 0).all()
+    assert (canvas[:, 200:] == 0).all()
@@ -0,0 +1,41 @@
+"""
+Tests for services/color_utils.py and the PRIMARY_COLOR gradient.
+
+Run with:
+    python3 -m pytest tests/
+"""
+
+import pytest
+
+from commands.generate_mockups import GradientStyle
+from config.screenshot_config import DecorativeCurvesConfig
+from services.color_utils import hex_to_rgb, lighten_color
+
+
+@pytest.mark.parametrize("hex_color", ["#FF5733", "FF5733", "#ff5733"])
+def test_hex_to_rgb(hex_color):
+    assert hex_to_rgb(hex_color) == (255, 87, 51)
+
+
+@pytest.mark.parametrize("hex_color", ["#FFF", "#FF5733AA", "#GG0000", "f_f573", " ff573", ""])
+def test_hex_to_rgb_rejects_malformed(hex_color):
+    with pytest.raises(ValueError):
+        hex_to_rgb(hex_color)
+
+
+@pytest.mark.parametrize("env_color", ["#6B46C1", "6B46C1", "#6B46C1FF"])
+def test_custom_gradient_from_env(monkeypatch, env_color):
+    monkeypatch.setenv('PRIMARY_COLOR', env_color)
+
+    name, start, end = GradientStyle.get_custom_from_env()
+
+    assert (name, start, end) == ("Client Primary", "#6B46C1", "#4a3187")
+    # The curve color the mockup renderers derive from the gradient start
+    assert lighten_color(start, DecorativeCurvesConfig.LIGHTNESS_INCREASE) == "#a892db"
+
+
+@pytest.mark.parametrize("env_color", ["#FFF", "not-a-color"])
+def test_custom_gradient_from_env_rejects_malformed(monkeypatch, env_color):
+    monkeypatch.setenv('PRIMARY_COLOR', env_color)
+
+    assert GradientStyle.get_custom_from_env() is None
@@ -0,0 +1,71 @@
+"""
+Tests for main.py: subcommand detection and the lazily built parser.
+
+Run with:
+    python3 -m pytest tests/
+"""
+
+import pytest
+
+import main
+from main import _detect_command, create_parser, SUBCOMMANDS
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["capture"], "capture"),
+    (["mockups", "--no-ipad"], "mockups"),
+    (["-v", "-p", "app", "pipeline", "--skip-tests"], "pipeline"),
+    (["pipeline", "--help"], "pipeline"),
+    (["--help", "mockups"], None),
+    (["-h"], None),
+    ([], None),
+    (["unknown"], None),
+])
+def test_detect_command(argv, expected):
+    assert _detect_command(argv) == expected
+
+
+@pytest.mark.parametrize("command", list(SUBCOMMANDS))
+def test_create_parser_builds_only_selected_subcommand(command):
+    parser = create_parser(command, with_epilogs=False)
+    subparsers = parser._subparsers._group_actions[0]
+
+    assert list(subparsers.choices) == [command]
+
+
+def test_create_parser_without_command_builds_all():
+    parser = create_parser()
+    subparsers = parser._subparsers._group_actions[0]
+
+    assert list(subparsers.choices) == list(SUBCOMMANDS)
+
+
+@pytest.mark.parametrize("argv", [
+    ["capture"],
+    ["capture", "--device", "Pixel 8 Pro", "--platform", "android", "--skip-tests"],
+    ["mockups"],
+    ["-p", "app", "mockups", "--device-choice", "2", "--gradient-choice", "0", "--no-logo"],
+    ["mockups", "--gplay-only", "--isolate", "--no-cache"],
+    ["pipeline"],
+    ["-v", "pipeline", "--skip-tests", "--apple-only", "--angle-choice", "3", "--no-cache"],
+])
+def test_selected_parser_matches_full_parser(argv):
+    selected = create_parser(_detect_command(argv), with_epilogs=False)
+    full = create_parser()
+
+    assert vars(selected.parse_args(argv)) == vars(full.parse_args(argv))
+
+
+def test_parse_defaults():
+    args = create_parser("pipeline", with_epilogs=False).parse_args(["pipeline"])
+
+    assert args.command == "pipeline"
+    assert args.device == main.DEFAULT_DEVICE
+    assert args.platform == main.DEFAULT_PLATFORM
+    assert args.use_cache is True
+    assert args.add_logo is None
+
+
+def test_missing_command_exits():
+    with pytest.raises(SystemExit):
+        create_parser(_detect_command([]), with_epilogs=False).parse_args([])
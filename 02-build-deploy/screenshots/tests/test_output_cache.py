@@ -0,0 +1,53 @@
+"""
+Tests for the mockup output cache location.
+
+Run with:
+    python3 -m pytest tests/
+"""
+
+from unittest import mock
+
+from commands.capture import ScreenshotCapture
+from commands.generate_mockups import MockupGenerator
+from services.flutter import FlutterService
+from services.imagemagick import ImageMagickService
+
+
+def _make_generator(screenshots_dir):
+    with mock.patch.object(ImageMagickService, '_detect_imagemagick_cmd', return_value='magick'):
+        return MockupGenerator(screenshots_dir=screenshots_dir)
+
+
+def _make_capture(screenshots_dir, white_label_dir):
+    with mock.patch.object(FlutterService, '_check_flutter_available'):
+        return ScreenshotCapture(
+            platform='android',
+            screenshots_dir=screenshots_dir,
+            white_label_dir=white_label_dir
+        )
+
+
+def test_output_cache_survives_capture_cleanup(tmp_path):
+    screenshots_dir = tmp_path / "screenshots"
+    generator = _make_generator(screenshots_dir)
+    capture = _make_capture(screenshots_dir, tmp_path)
+
+    # State left behind by a previous pipeline run
+    generator.output_cache_dir.mkdir(parents=True)
+    cached = generator.output_cache_dir / "abc123_iphone.png"
+    cached.write_bytes(b"png")
+    generator.iphone_output_dir.mkdir(parents=True)
+    (generator.iphone_output_dir / "01_home.png").write_bytes(b"png")
+    (screenshots_dir / "01_home.png").write_bytes(b"png")
+
+    capture._prepare_environment()
+
+    assert not capture.mockups_dir.exists()
+    assert not (screenshots_dir / "01_home.png").exists()
+    assert cached.read_bytes() == b"png"
+
+
+def test_output_cache_is_outside_output_dir(tmp_path):
+    generator = _make_generator(tmp_path / "screenshots")
+
+    assert generator.output_dir not in generator.output_cache_dir.parents